@@ -16,32 +16,65 @@ Repository: https://github.com/lnm8910/citation-doi-validator
 """
 
 import argparse
+import contextlib
+import copy
+import functools
+import io
 import json
+import mmap
 import re
+import sqlite3
 import sys
+import threading
 import time
+import unicodedata
 import warnings
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+from urllib.parse import urlsplit
 from difflib import SequenceMatcher
 
-# Suppress the urllib3 LibreSSL warning that fires on macOS-system-Python the moment
-# urllib3 is imported. This must run *before* `import requests`.
-warnings.filterwarnings("ignore", message=r"urllib3 v2 only supports OpenSSL 1\.1\.1\+")
+# `requests` (with urllib3 and certifi, most of this module's import time) is
+# imported on first use by _require_requests(), so `--help`, `--version` and
+# library users that only parse or report never pay for it.
+requests = None
 
-try:
-    import requests
-except ImportError:
-    print("Error: 'requests' library not found. Install with: pip install requests", file=sys.stderr)
-    sys.exit(1)
+# Optional accelerators, also imported on first use (by _optional_orjson() and
+# _optional_indel()): together they cost about as much import time as the rest
+# of the module. Until then they hold _UNRESOLVED; afterwards the module, or None
+# when it is not installed.
+_UNRESOLVED = object()
+orjson = _UNRESOLVED  # optional: faster decoding of large API responses
+Indel = _UNRESOLVED   # optional (rapidfuzz): C upper bound for SequenceMatcher ratios
 
 
 __version__ = "1.2.0"
 __author__ = "Lalit Narayan Mishra"
 
 
-RATE_LIMIT_SECONDS = 0.5
+RATE_LIMIT_SECONDS = 0.5  # per API host
+RATE_LIMIT_BURST = 1      # requests a host may receive back-to-back before spacing applies
+
+# Entries verified concurrently by ``verify_citations``. Verification is I/O-bound,
+# so worker threads overlap network round-trips; the shared rate limiter still caps
+# the request rate, so this raises throughput without raising pressure on the APIs.
+DEFAULT_WORKERS = 4
+
+# Keep-alive connection pool sizing. One pool per API host (CrossRef, doi.org,
+# Semantic Scholar, OpenAlex, DBLP), each large enough that concurrent workers
+# reuse warm TCP/TLS connections instead of opening and discarding extra ones
+# (requests' default of 10 per host drops connections once workers exceed it).
+HTTP_POOL_HOSTS = 8
+HTTP_POOL_MAXSIZE = 32
+# Connection-level retries (DNS failure, refused/reset connect, connect timeout)
+# done by urllib3 inside the pool. Nothing was sent yet, so they are safe for any
+# request; HTTP 429/503 retries stay in ``_http_get``, which honors Retry-After.
+HTTP_CONNECT_RETRIES = 2
+HTTP_CONNECT_BACKOFF = 0.5  # seconds, doubled per retry by urllib3
 
 LAST_NAME_MATCH_THRESHOLD = 0.9
 GIVEN_INITIAL_MUST_AGREE = True
@@ -51,6 +84,8 @@ AUTHORS_FABRICATED_THRESHOLD = 0.5
 TITLE_MATCH_THRESHOLD = 0.8
 
 S2_CONFIRMING_TITLE_THRESHOLD = 0.85
+CROSSREF_BATCH_SIZE = 50  # DOIs per CrossRef /works?filter=doi:... request
+DOI_RA_BATCH_SIZE = 100  # DOI prefixes per https://doi.org/ra/ request
 
 # Reverse-lookup (DOI-less confirmation) thresholds. A DOI-less entry is confirmed
 # only with high title similarity AND author corroboration, which guards against
@@ -66,9 +101,151 @@ REVLOOKUP_ROWS = 5                   # candidates requested per source
 # no key, generous limits, and it indexes arXiv plus proceedings with authors + DOIs,
 # unlike DBLP / keyless Semantic Scholar which throttle aggressively on batch runs.
 OPENALEX_MAILTO = "citation-doi-validator@users.noreply.github.com"
+# CrossRef "polite pool" contact, sent as ``mailto`` on batch DOI queries.
+CROSSREF_MAILTO = OPENALEX_MAILTO
+
+# Registration agency by DOI prefix, for prefixes known to be registered outside
+# CrossRef. CrossRef 404s on these, so verify_citation asks doi.org first instead
+# of spending a round-trip on the miss. Other prefixes are resolved on demand via
+# https://doi.org/ra/ (see lookup_registrars); unknown ones go to CrossRef first.
+DOI_PREFIX_REGISTRAR = {
+    '10.5281': 'DataCite',   # Zenodo
+    '10.5061': 'DataCite',   # Dryad
+    '10.6084': 'DataCite',   # figshare
+    '10.17605': 'DataCite',  # OSF
+    '10.7910': 'DataCite',   # Harvard Dataverse
+    '10.48550': 'DataCite',  # arXiv
+}
+
+# Persistent lookup cache. Re-running over the same bibliography (the usual edit /
+# re-check loop) answers previously seen DOIs and titles from disk instead of the
+# network. Successful lookups are kept for CACHE_TTL_SECONDS; definite negatives
+# ("DOI not registered", "search found nothing") for the shorter
+# CACHE_NEGATIVE_TTL_SECONDS, since new DOIs get registered. Transient errors are
+# never stored.
+CACHE_PATH = Path.home() / '.cache' / 'citation-doi-validator' / 'cache.sqlite'
+CACHE_TTL_SECONDS = 30 * 86400
+CACHE_NEGATIVE_TTL_SECONDS = 86400
 
 _DOI_URL_PREFIX = re.compile(r'^\s*(?:https?://)?(?:dx\.)?doi\.org/', re.IGNORECASE)
 
+# BibTeX files are scanned as bytes over an mmap; braces, '@' and ',' are ASCII,
+# so byte offsets delimit entries correctly in UTF-8 text.
+_BIB_ENTRY_HEAD = re.compile(rb'@(\w+)\s*\{')
+_BRACE = re.compile(r'(\{)|\}')
+_BRACE_BYTES = re.compile(rb'(\{)|\}')
+# Inside an entry body: a field name and its '=' (the value starts at match end),
+# and an unquoted value such as ``year = 2021``, which runs to the next ',' or newline.
+_BIB_FIELD_NAME = re.compile(r'([\w-]+)[ \t\r\n]*=[ \t\r\n]*')
+_BIB_BARE_VALUE = re.compile(r'[^,\n]*')
+
+# LaTeX accent forms in author names: \'{e}, {\'e} / {e}, and \'e.
+_LATEX_ACCENT_BRACED_ARG = re.compile(r'\\[\'"`^~=.]\{(.)\}')
+_LATEX_ACCENT_GROUP = re.compile(r'\{\\[\'"`^~=.]?(.)\}')
+_LATEX_ACCENT_BARE = re.compile(r'\\[\'"`^~=.](.)')
+_AUTHOR_SEPARATOR = re.compile(r'\s+and\s+')
+
+# Reverse-lookup helpers: DBLP's numeric suffix for homonymous authors
+# ("Wei Wang 0001"), a DOI inside DBLP's electronic-edition URL, and the
+# characters OpenAlex's title.search filter cannot take.
+_DBLP_HOMONYM_SUFFIX = re.compile(r'\s+\d{3,4}$')
+_DOI_IN_TEXT = re.compile(r'(10\.\d{4,9}/\S+)')
+_OPENALEX_FILTER_UNSAFE = re.compile(r'[^\w\s-]')
+
+
+def _optional_orjson():
+    """Import ``orjson`` into the module namespace on first call; return it, or None."""
+    global orjson
+    if orjson is _UNRESOLVED:
+        try:
+            import orjson as module
+        except ImportError:
+            module = None
+        orjson = module
+    return orjson
+
+
+def _optional_indel():
+    """Import rapidfuzz's ``Indel`` into the module namespace on first call; return it, or None."""
+    global Indel
+    if Indel is _UNRESOLVED:
+        try:
+            from rapidfuzz.distance import Indel as module
+        except ImportError:
+            module = None
+        Indel = module
+    return Indel
+
+
+def _json_loads(data: bytes):
+    """Decode a JSON response body, with ``orjson`` when installed (else stdlib ``json``).
+
+    Raises ``ValueError`` on malformed input either way.
+    """
+    fast = _optional_orjson()
+    if fast is not None:
+        return fast.loads(data)
+    return json.loads(data)
+
+
+def _plain_floats_only(obj) -> bool:
+    """True if every float in ``obj`` (values and dict keys) prints the same in ``orjson`` and ``json``.
+
+    The two agree on finite floats that ``repr`` writes without an exponent.
+    They differ on the rest: ``1e-05`` vs ``0.00001``, ``1e+20`` vs ``1e20``,
+    and NaN/Infinity, which orjson writes as ``null``.
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is str or kind is int or kind is bool or value is None:
+            continue  # the bulk of a report; skip the isinstance checks
+        if isinstance(value, dict):
+            stack.extend(value.values())
+            stack.extend(key for key in value if isinstance(key, float))
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float) and not (1e-4 <= abs(value) < 1e16 or value == 0.0):
+            return False
+    return True
+
+
+def _json_dump(obj, out: TextIO) -> None:
+    """Write ``obj`` as indented JSON (2 spaces, non-ASCII kept) to a text stream.
+
+    Uses ``orjson`` when installed, which serializes in one native call; falls
+    back to stdlib ``json`` when it is not, for values orjson rejects (e.g.
+    integers beyond 64 bits), and for floats orjson would format differently
+    (``_plain_floats_only``), so the output is byte-identical either way.
+    """
+    fast = _optional_orjson()
+    if fast is not None and _plain_floats_only(obj):
+        try:
+            out.write(fast.dumps(obj, option=fast.OPT_INDENT_2 | fast.OPT_NON_STR_KEYS).decode('utf-8'))
+            return
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    json.dump(obj, out, indent=2, ensure_ascii=False)
+
+
+def _ratio_may_reach(str1: str, str2: str, threshold: float) -> bool:
+    """Cheap check that ``SequenceMatcher(None, str1, str2).ratio()`` can reach ``threshold``.
+
+    With ``rapidfuzz`` installed this is its Indel similarity, ``2*LCS/(len1+len2)``.
+    That is an upper bound on the ratio, because SequenceMatcher's matching
+    blocks form a common subsequence. A False answer means the ratio is
+    certainly below the threshold; the small slack absorbs float rounding
+    between the two libraries. Without rapidfuzz it always returns True, and
+    callers compute the ratio as before.
+    """
+    indel = _optional_indel()
+    if indel is None:
+        return True
+    # No score_cutoff: rapidfuzz rounds it to a distance bound, which can reject
+    # pairs sitting exactly on the threshold.
+    return indel.normalized_similarity(str1, str2) >= threshold - 1e-9
+
 
 def normalize_doi(raw: Optional[str]) -> str:
     """Normalize a DOI string by stripping URL prefix, whitespace, and surrounding punctuation.
@@ -83,12 +260,91 @@ def normalize_doi(raw: Optional[str]) -> str:
     return doi
 
 
+def entry_verification_key(entry: Dict) -> Tuple:
+    """Key identifying a BibTeX entry by the fields ``verify_citation`` reads.
+
+    Entries with equal keys (e.g. the same work cited twice in a merged .bib
+    file) verify to the same result apart from their citation key and type.
+    """
+    return (
+        entry.get('doi', ''),
+        entry.get('title', ''),
+        entry.get('author', ''),
+        entry.get('year', ''),
+        entry.get('journal') or entry.get('booktitle', ''),
+    )
+
+
+def _find_closing_brace(text, start: int) -> int:
+    """Return the index of the ``}`` closing a brace opened just before ``start``.
+
+    Works on ``str`` or bytes-like text (including an ``mmap``). Jumps between
+    braces with a compiled pattern instead of stepping through every character.
+    Returns -1 when the brace is never closed.
+    """
+    depth = 1
+    for m in (_BRACE if isinstance(text, str) else _BRACE_BYTES).finditer(text, start):
+        if m.group(1):
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return m.start()
+    return -1
+
+
+def _decode_bib_text(raw: bytes) -> str:
+    """Decode a slice of a BibTeX file, normalizing newlines as text-mode reads do."""
+    text = raw.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _build_accent_table() -> Dict[int, str]:
+    """Map accented Latin letters (Latin-1 Supplement and Latin Extended-A) to ASCII.
+
+    Letters that decompose under NFKD map to their base letter; the common ones
+    that do not (ø, ł, đ, ß, æ, œ, ı) are spelled out.
+    """
+    table = {}
+    for code in range(0xC0, 0x180):
+        base = ''.join(ch for ch in unicodedata.normalize('NFKD', chr(code))
+                       if not unicodedata.combining(ch))
+        if base != chr(code) and base.isascii():
+            table[code] = base
+    table.update(str.maketrans({
+        'ø': 'o', 'Ø': 'O', 'ł': 'l', 'Ł': 'L', 'đ': 'd', 'Đ': 'D', 'ß': 'ss',
+        'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE', 'ı': 'i',
+    }))
+    return table
+
+
+_ACCENT_TABLE = _build_accent_table()
+
+
+def fold_accents(text: str) -> str:
+    """Strip diacritics for comparison: "Rodríguez" -> "Rodriguez", "Østergaard" -> "Ostergaard".
+
+    Latin letters go through one ``str.translate`` table; only text with other
+    non-ASCII characters left falls back to NFKD decomposition. Letters without
+    an ASCII form (e.g. CJK) are kept.
+    """
+    if text.isascii():
+        return text
+    text = text.translate(_ACCENT_TABLE)
+    if text.isascii():
+        return text
+    return ''.join(ch for ch in unicodedata.normalize('NFKD', text) if not unicodedata.combining(ch))
+
+
 def split_name(full: str) -> Tuple[str, str, str]:
     """Split a normalized "given family" name into (given_full, given_initial, family).
 
     Robust to single-token names (returns family only) and multi-token given names.
+    Diacritics are folded (``fold_accents``) so "Müller" matches "Muller".
     """
-    full = full.strip()
+    full = fold_accents(full.strip())
     if not full:
         return ('', '', '')
     parts = full.split()
@@ -104,6 +360,298 @@ def split_name(full: str) -> Tuple[str, str, str]:
     return (given_full.lower(), given_initial, family.lower())
 
 
+# Lookup errors that are a definite answer rather than a failure to get one
+_NEGATIVE_ERRORS = frozenset({'DOI_NOT_FOUND', 'NOT_FOUND'})
+
+
+def _is_negative_result(value) -> bool:
+    """True for a lookup result that says "does not exist": an empty candidate
+    list or a ``DOI_NOT_FOUND`` / ``NOT_FOUND`` error dict."""
+    if isinstance(value, dict):
+        return value.get('error') in _NEGATIVE_ERRORS
+    return not value
+
+
+def _is_cacheable_result(value) -> bool:
+    """True for results worth storing: successes and definite negatives."""
+    if value is None:
+        return False
+    if isinstance(value, dict) and 'error' in value:
+        return value['error'] in _NEGATIVE_ERRORS
+    return True
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of API lookup results, keyed by ``(namespace, key)``
+
+    Entries older than ``ttl`` seconds (``negative_ttl`` for negative results,
+    see ``_is_negative_result``) are treated as misses by ``get``, but are kept
+    (with any HTTP ``ETag`` / ``Last-Modified`` validators) so callers can
+    revalidate them with a conditional request. The database runs in WAL mode
+    and is safe to share across the worker threads of ``verify_citations``.
+
+    Once open, the cache never fails a lookup: an SQLite error (another process
+    holding the write lock, a full disk, a corrupt page) is reported once on
+    stderr and then treated as a miss, or as a skipped write. After a failed
+    write the cache stops writing, so a lock held by another process costs one
+    busy timeout per run rather than one per lookup.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, ttl: float = CACHE_TTL_SECONDS,
+                 negative_ttl: float = CACHE_NEGATIVE_TTL_SECONDS):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = min(negative_ttl, ttl)
+        self._lock = threading.Lock()
+        self._warned = False
+        self._writable = True
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL, payload TEXT NOT NULL,"
+                " etag TEXT, last_modified TEXT,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(lookups)")}
+            for column in ('etag', 'last_modified'):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE lookups ADD COLUMN {column} TEXT")
+
+    def _warn(self, error: Exception) -> None:
+        """Report the first cache error on stderr; later ones are ignored silently."""
+        if not self._warned:
+            self._warned = True
+            print(f"Warning: lookup cache error ({error}); continuing without cached results",
+                  file=sys.stderr)
+
+    def get_entry(self, namespace: str, key: str) -> Optional[Dict]:
+        """Return ``{value, fresh, etag, last_modified}`` for a stored entry, expired or not."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT fetched_at, payload, etag, last_modified FROM lookups"
+                    " WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+            if row is None:
+                return None
+            value = json.loads(row[1])
+        except (sqlite3.Error, ValueError) as e:
+            self._warn(e)
+            return None
+        ttl = self.negative_ttl if _is_negative_result(value) else self.ttl
+        return {
+            'value': value,
+            'fresh': row[0] >= time.time() - ttl,
+            'etag': row[2],
+            'last_modified': row[3],
+        }
+
+    def get(self, namespace: str, key: str) -> Optional[Dict]:
+        """Return the cached value, or None when missing or expired."""
+        entry = self.get_entry(namespace, key)
+        return entry['value'] if entry and entry['fresh'] else None
+
+    def set(self, namespace: str, key: str, value: Dict,
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a JSON-serializable value (and its HTTP validators), replacing any previous entry."""
+        if not self._writable:
+            return
+        payload = json.dumps(value, ensure_ascii=False)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO lookups"
+                    " (namespace, key, fetched_at, payload, etag, last_modified)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (namespace, key, time.time(), payload, etag, last_modified),
+                )
+        except sqlite3.Error as e:
+            self._writable = False
+            self._warn(e)
+
+    def touch(self, namespace: str, key: str) -> None:
+        """Mark an entry as freshly fetched (after the server confirmed it is unchanged)."""
+        if not self._writable:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE lookups SET fetched_at = ? WHERE namespace = ? AND key = ?",
+                    (time.time(), namespace, key),
+                )
+        except sqlite3.Error as e:
+            self._writable = False
+            self._warn(e)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills at ``rate`` tokens/second, holds at most ``capacity``
+
+    Refill is computed lazily on ``acquire`` (no background thread). A caller that
+    finds the bucket empty reserves the next token and sleeps outside the lock, so
+    concurrent callers queue in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _cached_lookup(namespace: str, key: Callable[..., str] = lambda first, *rest: first.lower()):
+    """Serve a ``verify_via_*`` method from ``self.cache`` when one is configured.
+
+    ``key`` maps the method's arguments to the cache key (default: the first
+    argument, case-folded). Successes and definite negatives are stored (see
+    ``_is_cacheable_result``); transient errors never are.
+    """
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            if self.cache is None or not args or not args[0]:
+                return method(self, *args)
+            cache_key = key(*args)
+            cached = self.cache.get(namespace, cache_key)
+            if cached is not None:
+                self.log(f"Cache hit ({namespace}): {cache_key[:60]}")
+                return cached
+            result = method(self, *args)
+            if _is_cacheable_result(result):
+                self.cache.set(namespace, cache_key, result)
+            return result
+        return wrapper
+    return decorate
+
+
+# Lookup errors that may succeed on a retry; these are never memoized for the run
+_TRANSIENT_ERRORS = frozenset({'API_ERROR', 'DOI_API_ERROR', 'INVALID_RESPONSE'})
+
+
+def _title_key(title: str, *rest) -> str:
+    """Memo/cache key for title lookups: case-folded, whitespace-normalized."""
+    return ' '.join(title.lower().split())
+
+
+def _search_key(title: str, rows: int = REVLOOKUP_ROWS) -> str:
+    """Memo key for reverse-lookup searches: normalized title plus row count."""
+    return f"{rows}:{_title_key(title)}"
+
+
+def _run_memoized(namespace: str, key: Callable[..., str] = lambda first, *rest: first.lower()):
+    """Answer repeated ``verify_via_*`` calls within one run from memory.
+
+    Bibliographies cite the same paper under several keys; each distinct DOI or
+    title is looked up once per ``CitationVerifier`` and the result is shared by
+    every entry that asks for it (results are treated as read-only). Concurrent
+    workers asking for the same key wait on a per-key lock instead of issuing
+    duplicate requests. ``None`` and transient errors (``_TRANSIENT_ERRORS``)
+    are not memoized, so a later entry retries them.
+    """
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            if not args or not args[0]:
+                return method(self, *args)
+            memo_key = (namespace, key(*args))
+            with self._memo_lock:
+                if memo_key in self._memo:
+                    return self._memo[memo_key]
+                key_lock = self._memo_key_locks.setdefault(memo_key, threading.Lock())
+            with key_lock:
+                with self._memo_lock:
+                    if memo_key in self._memo:
+                        return self._memo[memo_key]
+                result = method(self, *args)
+                transient = isinstance(result, dict) and result.get('error') in _TRANSIENT_ERRORS
+                if result is not None and not transient:
+                    with self._memo_lock:
+                        self._memo[memo_key] = result
+            return result
+        return wrapper
+    return decorate
+
+
+def _require_requests():
+    """Import ``requests`` into the module namespace on first call and return it."""
+    global requests
+    if requests is None:
+        # Suppress the urllib3 LibreSSL warning that fires on macOS-system-Python the
+        # moment urllib3 is imported. This must run *before* `import requests`.
+        warnings.filterwarnings("ignore", message=r"urllib3 v2 only supports OpenSSL 1\.1\.1\+")
+        try:
+            import requests
+        except ImportError:
+            print("Error: 'requests' library not found. Install with: pip install requests", file=sys.stderr)
+            sys.exit(1)
+    return requests
+
+
+def make_session() -> 'requests.Session':
+    """
+    Create the HTTP session used for API calls
+
+    Sends the tool's User-Agent (with a ``mailto`` contact, per the CrossRef and
+    OpenAlex etiquette) and mounts a keep-alive connection pool sized for
+    concurrent workers (``HTTP_POOL_HOSTS`` x ``HTTP_POOL_MAXSIZE``), so TCP/TLS
+    connections to each API host are reused. Failed connection attempts are
+    retried ``HTTP_CONNECT_RETRIES`` times with backoff before a lookup sees an
+    error. One session can be shared by several ``CitationVerifier`` instances.
+
+    Returns:
+        requests.Session: Configured session
+    """
+    _require_requests()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': f'CitationDOIValidator/{__version__} (Academic Research Tool; mailto:{CROSSREF_MAILTO})'
+    })
+    # Only connect errors are retried here; read errors are raised as before
+    # (read=False keeps requests' ReadTimeout), and responses are never retried.
+    retry = Retry(
+        total=HTTP_CONNECT_RETRIES,
+        connect=HTTP_CONNECT_RETRIES,
+        read=False,
+        status=0,
+        backoff_factor=HTTP_CONNECT_BACKOFF,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_HOSTS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class CitationVerifier:
     """
     Verifies citation authenticity using multiple academic APIs
@@ -111,156 +659,176 @@ class CitationVerifier:
     Attributes:
         verbose (bool): Enable verbose logging
         session (requests.Session): HTTP session for API calls
+        cache (Optional[ResponseCache]): Persistent lookup cache (None disables it)
         crossref_api (str): CrossRef API endpoint
         semantic_scholar_api (str): Semantic Scholar API endpoint
     """
 
-    def __init__(self, verbose=False):
+    def __init__(
+        self,
+        verbose=False,
+        cache: Optional[ResponseCache] = None,
+        session: Optional['requests.Session'] = None,
+    ):
         """
         Initialize Citation Verifier
 
         Args:
             verbose (bool): Enable verbose logging output
+            cache (Optional[ResponseCache]): Persistent lookup cache, or None
+            session (Optional[requests.Session]): HTTP session to use; defaults
+                to a new one from ``make_session()``
         """
+        _require_requests()  # the lookups catch requests.RequestException
         self.verbose = verbose
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': f'CitationDOIValidator/{__version__} (Academic Research Tool)'
-        })
+        self.cache = cache
+        self.session = session if session is not None else make_session()
 
         # API endpoints
         self.crossref_api = "https://api.crossref.org/works/"
         self.semantic_scholar_api = "https://api.semanticscholar.org/graph/v1/paper/"
 
-        # Rate limiting
-        self.last_request_time = 0
+        # DOI prefix -> registration agency (see registrar_for / lookup_registrars)
+        self.registrars: Dict[str, str] = dict(DOI_PREFIX_REGISTRAR)
+
+        # Lookup results memoized for this run (see _run_memoized)
+        self._memo: Dict[Tuple[str, str], object] = {}
+        self._memo_key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._memo_lock = threading.Lock()
+
+        # Executor for background lookups (reverse_lookup's CrossRef search);
+        # owned by verify_citations for the length of a batch, None otherwise
+        self._background: Optional[ThreadPoolExecutor] = None
+
+        # Rate limiting: one token bucket per API host, shared by all worker threads
         self.min_request_interval = RATE_LIMIT_SECONDS
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+
+    def _is_memoized(self, namespace: str, key: str) -> bool:
+        """True if this run already holds a result for ``(namespace, key)``."""
+        with self._memo_lock:
+            return (namespace, key) in self._memo
+
+    def _is_known(self, namespace: str, key: str) -> bool:
+        """True if a lookup would be answered by this run's memo or a fresh cache entry."""
+        if self._is_memoized(namespace, key):
+            return True
+        return self.cache is not None and self.cache.get(namespace, key) is not None
+
+    def _memoize(self, namespace: str, key: str, value) -> None:
+        """Seed this run's memo (see ``_run_memoized``), e.g. from a batch prefetch."""
+        with self._memo_lock:
+            self._memo.setdefault((namespace, key), value)
 
     def log(self, message: str):
         """Print verbose logging with timestamp to stderr (so reports on stdout stay clean)."""
         if self.verbose:
             print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", file=sys.stderr)
 
-    def rate_limit(self):
-        """Enforce rate limiting between API calls to respect API quotas"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+    def rate_limit(self, url: str = ''):
+        """Enforce per-host rate limiting between API calls to respect API quotas.
+
+        Each host gets its own ``TokenBucket`` (one request per
+        ``min_request_interval``, bursts up to ``RATE_LIMIT_BURST``), so a lookup
+        against one API never waits on another API's quota. Thread-safe.
+        """
+        if self.min_request_interval <= 0:
+            return
+        host = urlsplit(url).netloc
+        with self._buckets_lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(1.0 / self.min_request_interval, RATE_LIMIT_BURST)
+                self._buckets[host] = bucket
+        bucket.acquire()
 
     def parse_bibtex_file(self, filepath: Path) -> List[Dict]:
         """
         Parse BibTeX file and extract citation entries.
 
         Uses a brace-balanced scanner so titles like ``{{TravisTorrent}: ...}``
-        are preserved instead of being truncated at the first inner ``}``.
+        are preserved instead of being truncated at the first inner ``}``. The file
+        is memory-mapped and scanned as bytes; only each entry's own slice is
+        decoded, so a large bibliography is never held in memory as one string.
+        Input that cannot be mapped (an empty file, a pipe such as ``/dev/stdin``
+        or ``<(...)``) is read into memory and scanned the same way.
         """
         self.log(f"Parsing BibTeX file: {filepath}")
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         entries = []
+        with open(filepath, 'rb') as f:
+            try:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                content = None
+            if content is not None:
+                with content:
+                    self._scan_entries(content, entries)
+            else:
+                self._scan_entries(f.read(), entries)
+
+        self.log(f"Found {len(entries)} entries")
+        return entries
+
+    def _scan_entries(self, content, entries: List[Dict]) -> None:
+        """Find each ``@type{key, ...}`` block in the file bytes (an ``mmap`` or ``bytes``) and parse its fields."""
         i = 0
         n = len(content)
 
         while i < n:
-            at = content.find('@', i)
+            at = content.find(b'@', i)
             if at < 0:
                 break
-            type_match = re.match(r'@(\w+)\s*\{', content[at:])
+            type_match = _BIB_ENTRY_HEAD.match(content, at)
             if not type_match:
                 i = at + 1
                 continue
-            entry_type = type_match.group(1)
-            cursor = at + type_match.end()
+            entry_type = type_match.group(1).decode('ascii')
+            cursor = type_match.end()
 
-            comma = content.find(',', cursor)
+            comma = content.find(b',', cursor)
             if comma < 0:
                 break
-            entry_key = content[cursor:comma].strip()
+            entry_key = _decode_bib_text(content[cursor:comma]).strip()
             cursor = comma + 1
 
             fields = {'type': entry_type, 'key': entry_key}
-            depth = 1
-            field_buf = []
-            while cursor < n and depth > 0:
-                ch = content[cursor]
-                if ch == '{':
-                    depth += 1
-                    field_buf.append(ch)
-                elif ch == '}':
-                    depth -= 1
-                    if depth == 0:
-                        break
-                    field_buf.append(ch)
-                else:
-                    field_buf.append(ch)
-                cursor += 1
-            fields_str = ''.join(field_buf)
+            close = _find_closing_brace(content, cursor)
+            fields_str = _decode_bib_text(content[cursor:close] if close >= 0 else content[cursor:])
 
             self._parse_fields(fields_str, fields)
             entries.append(fields)
 
-            i = cursor + 1 if depth == 0 else n
-
-        self.log(f"Found {len(entries)} entries")
-        return entries
+            i = close + 1 if close >= 0 else n
 
     def _parse_fields(self, body: str, fields: Dict) -> None:
         """Extract ``name = value`` pairs from a BibTeX entry body, brace-balanced."""
-        i = 0
+        pos = 0
         n = len(body)
-        while i < n:
-            while i < n and body[i] in ' \t\r\n,':
-                i += 1
-            if i >= n:
-                break
-            name_start = i
-            while i < n and (body[i].isalnum() or body[i] in '_-'):
-                i += 1
-            name = body[name_start:i].strip()
-            if not name:
-                i += 1
-                continue
-            while i < n and body[i] in ' \t\r\n':
-                i += 1
-            if i >= n or body[i] != '=':
-                continue
-            i += 1
-            while i < n and body[i] in ' \t\r\n':
-                i += 1
-            if i >= n:
+        while True:
+            name_match = _BIB_FIELD_NAME.search(body, pos)
+            if not name_match or name_match.end() >= n:
                 break
-            if body[i] == '{':
-                depth = 1
-                i += 1
-                value_start = i
-                while i < n and depth > 0:
-                    if body[i] == '{':
-                        depth += 1
-                    elif body[i] == '}':
-                        depth -= 1
-                        if depth == 0:
-                            break
-                    i += 1
-                value = body[value_start:i]
-                i += 1
-            elif body[i] == '"':
-                i += 1
-                value_start = i
-                while i < n and body[i] != '"':
-                    i += 1
-                value = body[value_start:i]
-                i += 1
+            start = name_match.end()
+            opener = body[start]
+            if opener == '{':
+                close = _find_closing_brace(body, start + 1)
+                if close < 0:
+                    close = n
+                value = body[start + 1:close]
+                pos = close + 1
+            elif opener == '"':
+                close = body.find('"', start + 1)
+                if close < 0:
+                    close = n
+                value = body[start + 1:close]
+                pos = close + 1
             else:
-                value_start = i
-                while i < n and body[i] not in ',\n':
-                    i += 1
-                value = body[value_start:i]
-            value = value.strip()
-            value = self._strip_outer_braces(value)
-            fields[name.lower()] = value
+                bare = _BIB_BARE_VALUE.match(body, start)
+                value = bare.group()
+                pos = bare.end()
+            fields[name_match.group(1).lower()] = self._strip_outer_braces(value.strip())
 
     @staticmethod
     def _strip_outer_braces(value: str) -> str:
@@ -282,52 +850,47 @@ class CitationVerifier:
 
     def clean_author_name(self, name: str) -> str:
         """Normalize an author name for comparison (LaTeX accents stripped, lowercased)."""
-        name = re.sub(r'\\[\'"`^~=.]\{(.)\}', r'\1', name)
-        name = re.sub(r'\{\\[\'"`^~=.]?(.)\}', r'\1', name)
-        name = re.sub(r'\\[\'"`^~=.](.)', r'\1', name)
-        name = name.replace('{', '').replace('}', '')
-        name = ' '.join(name.split())
-        return name.lower()
+        return self.display_author_name(name).lower()
 
     def display_author_name(self, name: str) -> str:
-        """Like ``clean_author_name`` but preserves original case (used for fix suggestions)."""
-        name = re.sub(r'\\[\'"`^~=.]\{(.)\}', r'\1', name)
-        name = re.sub(r'\{\\[\'"`^~=.]?(.)\}', r'\1', name)
-        name = re.sub(r'\\[\'"`^~=.](.)', r'\1', name)
-        name = name.replace('{', '').replace('}', '')
+        """Like ``clean_author_name`` but preserves original case (used for fix suggestions).
+
+        Every LaTeX accent form contains a backslash, so plain names (nearly all
+        API-sourced ones) skip the regex passes.
+        """
+        if '\\' in name:
+            name = _LATEX_ACCENT_BRACED_ARG.sub(r'\1', name)
+            name = _LATEX_ACCENT_GROUP.sub(r'\1', name)
+            name = _LATEX_ACCENT_BARE.sub(r'\1', name)
+        if '{' in name or '}' in name:
+            name = name.replace('{', '').replace('}', '')
         return ' '.join(name.split())
 
-    def parse_authors(self, author_string: str) -> List[str]:
-        """Parse BibTeX author string into list of normalized "given family" names."""
-        if not author_string:
-            return []
-        authors = re.split(r'\s+and\s+', author_string)
-        cleaned = []
-        for author in authors:
+    @staticmethod
+    def _split_author_field(author_string: str) -> List[str]:
+        """Split a BibTeX author field on ``and``, reordering "Last, First" to "First Last"."""
+        out = []
+        for author in _AUTHOR_SEPARATOR.split(author_string):
             if ',' in author:
                 parts = author.split(',')
                 last = parts[0].strip()
                 first = parts[1].strip() if len(parts) > 1 else ""
-                cleaned.append(f"{first} {last}".strip())
+                out.append(f"{first} {last}".strip())
             else:
-                cleaned.append(author.strip())
-        return [self.clean_author_name(a) for a in cleaned if a]
+                out.append(author.strip())
+        return [a for a in out if a]
+
+    def parse_authors(self, author_string: str) -> List[str]:
+        """Parse BibTeX author string into list of normalized "given family" names."""
+        if not author_string:
+            return []
+        return [self.clean_author_name(a) for a in self._split_author_field(author_string)]
 
     def parse_authors_display(self, author_string: str) -> List[str]:
         """Like ``parse_authors`` but preserves original casing — for fix suggestions."""
         if not author_string:
             return []
-        authors = re.split(r'\s+and\s+', author_string)
-        out = []
-        for author in authors:
-            if ',' in author:
-                parts = author.split(',')
-                last = parts[0].strip()
-                first = parts[1].strip() if len(parts) > 1 else ""
-                out.append(f"{first} {last}".strip())
-            else:
-                out.append(author.strip())
-        return [self.display_author_name(a) for a in out if a]
+        return [self.display_author_name(a) for a in self._split_author_field(author_string)]
 
     def similarity_ratio(self, str1: str, str2: str) -> float:
         """
@@ -340,12 +903,50 @@ class CitationVerifier:
         Returns:
             float: Similarity ratio (0.0-1.0)
         """
-        return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
+        return self._sim_normalized(str1.lower(), str2.lower())
+
+    @staticmethod
+    def _sim_normalized(str1: str, str2: str) -> float:
+        """``similarity_ratio`` for inputs the caller has already lower-cased.
+
+        Hot paths lower-case a string once and compare it many times; this
+        skips the per-call ``.lower()`` copies. Passing mixed-case input gives a
+        case-sensitive score.
+        """
+        return SequenceMatcher(None, str1, str2).ratio()
 
+    @staticmethod
+    def _sim_normalized_at_least(str1: str, str2: str, threshold: float) -> bool:
+        """Check ``_sim_normalized(str1, str2) >= threshold`` without always paying for it.
+
+        ``real_quick_ratio`` (lengths only) and ``quick_ratio`` (character
+        multiset overlap), or the tighter rapidfuzz bound when it is installed
+        (``_ratio_may_reach``), are upper bounds on ``ratio``, so an obvious
+        mismatch is rejected without the O(n*m) matching-block search. The answer is the
+        same as comparing the full ratio; use this where only the threshold
+        decision matters and the score itself is not reported. Inputs must be
+        lower-cased already.
+        """
+        matcher = SequenceMatcher(None, str1, str2)
+        if matcher.real_quick_ratio() < threshold:
+            return False
+        if _optional_indel() is not None:
+            if not _ratio_may_reach(str1, str2, threshold):
+                return False
+        elif matcher.quick_ratio() < threshold:
+            return False
+        return matcher.ratio() >= threshold
+
+    @_run_memoized('crossref')
     def verify_via_crossref(self, doi: str) -> Optional[Dict]:
         """
         Verify citation using CrossRef API
 
+        With a cache configured, a fresh cached record is returned without a
+        request. An expired one is revalidated with a conditional GET
+        (``If-None-Match`` / ``If-Modified-Since``); on ``304 Not Modified`` the
+        cached record is reused without re-downloading or re-parsing it.
+
         Args:
             doi (str): DOI to verify
 
@@ -355,68 +956,233 @@ class CitationVerifier:
         if not doi:
             return None
 
+        cache_key = doi.lower()
+        cached = self.cache.get_entry('crossref', cache_key) if self.cache is not None else None
+        if cached and cached['fresh']:
+            self.log(f"Cache hit (crossref): {cache_key}")
+            return cached['value']
+
         self.log(f"Querying CrossRef for DOI: {doi}")
-        self.rate_limit()
+        url = f"{self.crossref_api}{doi}"
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        try:
+            response = self._http_get(url, timeout=10, headers=headers or None)
+        except requests.RequestException as e:
+            self.log(f"CrossRef API error: {e}")
+            return {'error': 'API_ERROR', 'message': str(e)}
+
+        if response.status_code == 304 and cached:
+            self.log(f"CrossRef record unchanged for DOI: {doi}")
+            self.cache.touch('crossref', cache_key)
+            return cached['value']
+
+        if response.status_code == 404:
+            result = {'error': 'DOI_NOT_FOUND', 'status_code': 404}
+            if self.cache is not None:
+                self.cache.set('crossref', cache_key, result)
+            return result
+
+        if not response.ok:
+            self.log(f"CrossRef API error: HTTP {response.status_code}")
+            return {'error': 'API_ERROR', 'status_code': response.status_code}
 
         try:
-            url = f"{self.crossref_api}{doi}"
-            response = self.session.get(url, timeout=10)
+            data = _json_loads(response.content)
+        except ValueError as e:
+            self.log(f"CrossRef API error: {e}")
+            return {'error': 'API_ERROR', 'message': str(e)}
 
-            if response.status_code == 404:
-                return {'error': 'DOI_NOT_FOUND', 'status_code': 404}
+        if 'message' not in data:
+            return {'error': 'INVALID_RESPONSE'}
 
-            response.raise_for_status()
-            data = response.json()
+        result = self._result_from_crossref_message(data['message'])
 
-            if 'message' not in data:
-                return {'error': 'INVALID_RESPONSE'}
+        if self.cache is not None:
+            self.cache.set(
+                'crossref', cache_key, result,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+            )
+        return result
 
-            message = data['message']
+    def _result_from_crossref_message(self, message: Dict) -> Dict:
+        """Map a CrossRef work ``message`` to the ``verify_via_crossref`` result shape."""
+        # Extract relevant fields
+        result = {
+            'doi': message.get('DOI'),
+            'title': message.get('title', [None])[0],
+            'authors': [],
+            'year': None,
+            'venue': None,
+            'type': message.get('type'),
+            'raw': message
+        }
 
-            # Extract relevant fields
-            result = {
-                'doi': message.get('DOI'),
-                'title': message.get('title', [None])[0],
-                'authors': [],
-                'year': None,
-                'venue': None,
-                'type': message.get('type'),
-                'raw': message
-            }
+        # Parse authors — store both comparison form (lowercased, accent-stripped)
+        # and a display form (preserves casing) for fix suggestions
+        result['authors_display'] = []
+        if 'author' in message:
+            for author in message['author']:
+                family = author.get('family', '')
+                given = author.get('given', '')
+                display = self.display_author_name(f"{given} {family}")
+                result['authors'].append(display.lower())
+                result['authors_display'].append(display)
+
+        # Parse year
+        if 'published' in message:
+            date_parts = message['published'].get('date-parts', [[]])[0]
+            if date_parts:
+                result['year'] = date_parts[0]
+        elif 'created' in message:
+            date_parts = message['created'].get('date-parts', [[]])[0]
+            if date_parts:
+                result['year'] = date_parts[0]
+
+        # Parse venue
+        if 'container-title' in message and message['container-title']:
+            result['venue'] = message['container-title'][0]
+        elif 'publisher' in message:
+            result['venue'] = message['publisher']
 
-            # Parse authors — store both comparison form (lowercased, accent-stripped)
-            # and a display form (preserves casing) for fix suggestions
-            result['authors_display'] = []
-            if 'author' in message:
-                for author in message['author']:
-                    family = author.get('family', '')
-                    given = author.get('given', '')
-                    full_name = f"{given} {family}".strip()
-                    result['authors'].append(self.clean_author_name(full_name))
-                    result['authors_display'].append(self.display_author_name(full_name))
-
-            # Parse year
-            if 'published' in message:
-                date_parts = message['published'].get('date-parts', [[]])[0]
-                if date_parts:
-                    result['year'] = date_parts[0]
-            elif 'created' in message:
-                date_parts = message['created'].get('date-parts', [[]])[0]
-                if date_parts:
-                    result['year'] = date_parts[0]
-
-            # Parse venue
-            if 'container-title' in message and message['container-title']:
-                result['venue'] = message['container-title'][0]
-            elif 'publisher' in message:
-                result['venue'] = message['publisher']
+        return result
 
-            return result
+    def batch_query_crossref(self, dois: List[str]) -> Dict[str, Dict]:
+        """
+        Look up many DOIs in CrossRef with ``/works?filter=doi:A,doi:B,...``
 
-        except requests.RequestException as e:
-            self.log(f"CrossRef API error: {e}")
-            return {'error': 'API_ERROR', 'message': str(e)}
+        Sends one request per ``CROSSREF_BATCH_SIZE`` DOIs instead of one per
+        citation, with ``mailto`` set for CrossRef's polite pool. DOIs missing
+        from a response are left out rather than reported as not found: the
+        per-DOI lookup still decides those.
+
+        Args:
+            dois (List[str]): Normalized DOIs
 
+        Returns:
+            Dict[str, Dict]: Lower-cased DOI -> result (same shape as
+            ``verify_via_crossref``) for the DOIs CrossRef returned
+        """
+        url = self.crossref_api.rstrip('/')
+        found = {}
+        # A comma inside a DOI would split the filter value; look those up singly
+        dois = [doi for doi in dois if ',' not in doi]
+        for start in range(0, len(dois), CROSSREF_BATCH_SIZE):
+            chunk = dois[start:start + CROSSREF_BATCH_SIZE]
+            self.log(f"Querying CrossRef batch for {len(chunk)} DOIs")
+            params = {
+                'filter': ','.join(f"doi:{doi}" for doi in chunk),
+                'rows': len(chunk),
+                'mailto': CROSSREF_MAILTO,
+            }
+            try:
+                response = self._http_get(url, params=params, timeout=30)
+            except requests.RequestException as e:
+                self.log(f"CrossRef batch error: {e}")
+                continue
+            if not response.ok:
+                self.log(f"CrossRef batch error: HTTP {response.status_code}")
+                continue
+            try:
+                items = _json_loads(response.content).get('message', {}).get('items', [])
+            except ValueError as e:
+                self.log(f"CrossRef batch error: {e}")
+                continue
+            for item in items:
+                if item.get('DOI'):
+                    found[item['DOI'].lower()] = self._result_from_crossref_message(item)
+        return found
+
+    def prefetch_crossref(self, entries: List[Dict]) -> None:
+        """Batch-fetch CrossRef records for every DOI in ``entries``.
+
+        Records are stored in the lookup cache (when configured) and in this
+        run's memo, so the per-entry ``verify_via_crossref`` calls that follow
+        are answered without a request. DOIs with a fresh cache entry are
+        skipped, and so are expired entries that carry HTTP validators: those
+        are left to the conditional GET in ``verify_via_crossref``, which reuses
+        the stored record on ``304`` and keeps its ``ETag`` / ``Last-Modified``.
+        Batch responses have no per-record validators, so records stored from a
+        batch are refreshed by the next batch once they expire.
+        """
+        dois = []
+        seen = set()
+        for entry in entries:
+            doi = normalize_doi(entry.get('doi', ''))
+            key = doi.lower()
+            if not doi or key in seen or self._is_memoized('crossref', key):
+                continue
+            seen.add(key)
+            if self.registrar_for(doi) not in (None, 'Crossref'):
+                continue
+            if self.cache is not None:
+                cached = self.cache.get_entry('crossref', key)
+                if cached and (cached['fresh'] or cached['etag'] or cached['last_modified']):
+                    continue
+            dois.append(doi)
+        if not dois:
+            return
+        found = self.batch_query_crossref(dois)
+        for key, result in found.items():
+            if key not in seen:
+                continue
+            if self.cache is not None:
+                self.cache.set('crossref', key, result)
+            self._memoize('crossref', key, result)
+        # DOIs CrossRef did not return may belong to another registrar
+        self.lookup_registrars({
+            doi.split('/', 1)[0] for doi in dois
+            if doi.lower() not in found and self.registrar_for(doi) is None
+        })
+
+    def registrar_for(self, doi: str) -> Optional[str]:
+        """Return the registration agency for a DOI's prefix ('Crossref',
+        'DataCite', ...), or None when it has not been looked up."""
+        return self.registrars.get(doi.split('/', 1)[0])
+
+    def lookup_registrars(self, prefixes) -> None:
+        """Resolve the registration agency of DOI prefixes via ``https://doi.org/ra/``.
+
+        Prefixes go in comma-separated batches of ``DOI_RA_BATCH_SIZE``; answers are kept in
+        ``self.registrars`` and in the lookup cache (namespace ``'ra'``), so each
+        prefix is resolved at most once per cache lifetime.
+        """
+        pending = []
+        for prefix in sorted(set(prefixes) - set(self.registrars)):
+            cached = self.cache.get('ra', prefix) if self.cache is not None else None
+            if cached is not None:
+                self.registrars[prefix] = cached['ra']
+            else:
+                pending.append(prefix)
+        for start in range(0, len(pending), DOI_RA_BATCH_SIZE):
+            chunk = pending[start:start + DOI_RA_BATCH_SIZE]
+            self.log(f"Looking up registration agency for {len(chunk)} DOI prefixes")
+            try:
+                response = self._http_get(f"https://doi.org/ra/{','.join(chunk)}", timeout=10)
+            except requests.RequestException as e:
+                self.log(f"doi.org RA lookup error: {e}")
+                continue
+            if not response.ok:
+                self.log(f"doi.org RA lookup error: HTTP {response.status_code}")
+                continue
+            try:
+                answers = _json_loads(response.content)
+            except ValueError as e:
+                self.log(f"doi.org RA lookup error: {e}")
+                continue
+            for answer in answers:
+                if isinstance(answer, dict) and answer.get('RA') and answer.get('DOI'):
+                    self.registrars[answer['DOI']] = answer['RA']
+                    if self.cache is not None:
+                        self.cache.set('ra', answer['DOI'], {'ra': answer['RA']})
+
+    @_run_memoized('doi_org')
+    @_cached_lookup('doi_org')
     def verify_via_doi_org(self, doi: str) -> Optional[Dict]:
         """
         Verify DOI existence using doi.org Handle System API
@@ -433,46 +1199,49 @@ class CitationVerifier:
             return None
 
         self.log(f"Querying doi.org for DOI: {doi}")
-        self.rate_limit()
-
+        # doi.org Handle System API
+        url = f"https://doi.org/api/handles/{doi}"
         try:
-            # doi.org Handle System API
-            url = f"https://doi.org/api/handles/{doi}"
-            response = self.session.get(url, timeout=10)
-
-            if response.status_code == 404:
-                return {'error': 'DOI_NOT_FOUND', 'status_code': 404}
-
-            if response.status_code != 200:
-                return {'error': 'DOI_API_ERROR', 'status_code': response.status_code}
-
-            data = response.json()
-
-            # Check if DOI exists
-            if data.get('responseCode') == 1:  # responseCode 1 = success
-                result = {
-                    'doi': doi,
-                    'exists': True,
-                    'handle': data.get('handle'),
-                    'values': data.get('values', []),
-                    'source': 'doi.org'
-                }
+            response = self._http_get(url, timeout=10)
+        except requests.RequestException as e:
+            self.log(f"doi.org API error: {e}")
+            return {'error': 'API_ERROR', 'message': str(e)}
 
-                # Try to extract URL from handle values
-                for value in data.get('values', []):
-                    if value.get('type') == 'URL':
-                        result['url'] = value.get('data', {}).get('value')
-                        break
+        if response.status_code == 404:
+            return {'error': 'DOI_NOT_FOUND', 'status_code': 404}
 
-                self.log(f"DOI {doi} exists in doi.org system")
-                return result
-            else:
-                return {'error': 'DOI_NOT_FOUND', 'responseCode': data.get('responseCode')}
+        if response.status_code != 200:
+            return {'error': 'DOI_API_ERROR', 'status_code': response.status_code}
 
-        except requests.RequestException as e:
+        try:
+            data = _json_loads(response.content)
+        except ValueError as e:
             self.log(f"doi.org API error: {e}")
             return {'error': 'API_ERROR', 'message': str(e)}
 
+        # Check if DOI exists
+        if data.get('responseCode') != 1:  # responseCode 1 = success
+            return {'error': 'DOI_NOT_FOUND', 'responseCode': data.get('responseCode')}
+
+        result = {
+            'doi': doi,
+            'exists': True,
+            'handle': data.get('handle'),
+            'values': data.get('values', []),
+            'source': 'doi.org'
+        }
+
+        # Try to extract URL from handle values
+        for value in data.get('values', []):
+            if value.get('type') == 'URL':
+                result['url'] = value.get('data', {}).get('value')
+                break
+
+        self.log(f"DOI {doi} exists in doi.org system")
+        return result
+
+    @_run_memoized('semantic_scholar', key=_title_key)
+    @_cached_lookup('semantic_scholar', key=_title_key)
     def verify_via_semantic_scholar(self, title: str, authors: List[str]) -> Optional[Dict]:
         """
         Verify citation using Semantic Scholar API
@@ -488,54 +1257,68 @@ class CitationVerifier:
             return None
 
         self.log(f"Querying Semantic Scholar for: {title[:50]}...")
-        self.rate_limit()
+        search_url = "https://api.semanticscholar.org/graph/v1/paper/search"
 
+        params = {
+            'query': title,
+            'limit': 1,
+            'fields': 'title,authors,year,venue,externalIds'
+        }
         try:
-            search_url = "https://api.semanticscholar.org/graph/v1/paper/search"
-            params = {
-                'query': title,
-                'limit': 1,
-                'fields': 'title,authors,year,venue,externalIds'
-            }
+            response = self._http_get(search_url, params=params, timeout=10)
+        except requests.RequestException as e:
+            self.log(f"Semantic Scholar API error: {e}")
+            return {'error': 'API_ERROR', 'message': str(e)}
 
-            response = self.session.get(search_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+        if not response.ok:
+            self.log(f"Semantic Scholar API error: HTTP {response.status_code}")
+            return {'error': 'API_ERROR', 'status_code': response.status_code}
 
-            if not data.get('data'):
-                return {'error': 'NOT_FOUND'}
+        try:
+            data = _json_loads(response.content)
+        except ValueError as e:
+            self.log(f"Semantic Scholar API error: {e}")
+            return {'error': 'API_ERROR', 'message': str(e)}
 
-            paper = data['data'][0]
+        if not data.get('data'):
+            return {'error': 'NOT_FOUND'}
 
-            result = {
-                'title': paper.get('title'),
-                'authors': [self.clean_author_name(a['name']) for a in paper.get('authors', [])],
-                'year': paper.get('year'),
-                'venue': paper.get('venue'),
-                'doi': paper.get('externalIds', {}).get('DOI'),
-                'raw': paper
-            }
+        paper = data['data'][0]
 
-            return result
+        result = {
+            'title': paper.get('title'),
+            'authors': [self.clean_author_name(a['name']) for a in paper.get('authors', [])],
+            'year': paper.get('year'),
+            'venue': paper.get('venue'),
+            'doi': paper.get('externalIds', {}).get('DOI'),
+            'raw': paper
+        }
 
-        except requests.RequestException as e:
-            self.log(f"Semantic Scholar API error: {e}")
-            return {'error': 'API_ERROR', 'message': str(e)}
+        return result
 
     # ----- Reverse lookup: confirm DOI-less entries by title/author/year -----
 
-    def _http_get(self, url: str, params: Optional[Dict] = None, timeout: int = 15, max_retries: int = 3):
+    def _http_get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        timeout: int = 15,
+        max_retries: int = 3,
+        headers: Optional[Dict] = None,
+    ):
         """Rate-limited GET with retry and backoff on 429/503 (honoring Retry-After).
 
         Free metadata APIs (DBLP, CrossRef, Semantic Scholar) throttle bursty batch
         runs; without this a transient 429 was being recorded as "not found" and the
-        best source (DBLP for CS papers) was silently lost mid-batch.
+        best source (DBLP for CS papers) was silently lost mid-batch. Every GET
+        the verifier makes goes through here, so concurrent workers that trip a
+        rate limit back off instead of failing the lookup.
         """
         backoff = 1.0
         response = None
         for attempt in range(max_retries + 1):
-            self.rate_limit()
-            response = self.session.get(url, params=params, timeout=timeout)
+            self.rate_limit(url)
+            response = self.session.get(url, params=params, timeout=timeout, headers=headers)
             if response.status_code in (429, 503) and attempt < max_retries:
                 retry_after = response.headers.get('Retry-After')
                 try:
@@ -556,8 +1339,9 @@ class CitationVerifier:
         for a in item.get('author', []) or []:
             full = f"{a.get('given', '')} {a.get('family', '')}".strip()
             if full:
-                authors.append(self.clean_author_name(full))
-                authors_display.append(self.display_author_name(full))
+                display = self.display_author_name(full)
+                authors.append(display.lower())
+                authors_display.append(display)
         year = None
         issued = item.get('issued', {}).get('date-parts', [[None]])
         if issued and issued[0]:
@@ -573,6 +1357,8 @@ class CitationVerifier:
             'source': 'crossref-search',
         }
 
+    @_run_memoized('crossref_search', key=_search_key)
+    @_cached_lookup('crossref_search', key=_search_key)
     def verify_via_crossref_search(self, title: str, rows: int = REVLOOKUP_ROWS) -> Optional[List[Dict]]:
         """Reverse lookup: find candidate works in CrossRef by bibliographic query.
 
@@ -583,19 +1369,26 @@ class CitationVerifier:
         if not title:
             return []
         self.log(f"Querying CrossRef search for: {title[:50]}...")
+        params = {
+            'query.bibliographic': title,
+            'rows': rows,
+            'select': 'DOI,title,author,issued,container-title,type',
+        }
         try:
-            params = {
-                'query.bibliographic': title,
-                'rows': rows,
-                'select': 'DOI,title,author,issued,container-title,type',
-            }
             response = self._http_get("https://api.crossref.org/works", params=params)
-            response.raise_for_status()
-            items = response.json().get('message', {}).get('items', [])
-            return [self._candidate_from_crossref_item(it) for it in items]
-        except (requests.RequestException, ValueError) as e:
+        except requests.RequestException as e:
+            self.log(f"CrossRef search error: {e}")
+            return None
+        if not response.ok:
+            self.log(f"CrossRef search error: HTTP {response.status_code}")
+            return None
+        try:
+            data = _json_loads(response.content)
+        except ValueError as e:
             self.log(f"CrossRef search error: {e}")
             return None
+        items = data.get('message', {}).get('items', [])
+        return [self._candidate_from_crossref_item(it) for it in items]
 
     def _candidate_from_dblp_info(self, info: Dict) -> Dict:
         """Map a DBLP publication 'info' object to a normalized candidate dict."""
@@ -606,16 +1399,17 @@ class CitationVerifier:
         for a in raw:
             name = a.get('text') if isinstance(a, dict) else a
             if name:
-                name = re.sub(r'\s+\d{3,4}$', '', str(name)).strip()  # drop DBLP homonym digits
-                authors.append(self.clean_author_name(name))
-                authors_display.append(self.display_author_name(name))
+                name = _DBLP_HOMONYM_SUFFIX.sub('', str(name)).strip()  # drop DBLP homonym digits
+                display = self.display_author_name(name)
+                authors.append(display.lower())
+                authors_display.append(display)
         try:
             year = int(info.get('year')) if info.get('year') else None
         except (TypeError, ValueError):
             year = None
         doi = normalize_doi(info.get('doi'))
         if not doi and info.get('ee'):
-            m = re.search(r'(10\.\d{4,9}/\S+)', info.get('ee', ''))
+            m = _DOI_IN_TEXT.search(info.get('ee', ''))
             if m:
                 doi = normalize_doi(m.group(1))
         return {
@@ -629,6 +1423,8 @@ class CitationVerifier:
             'source': 'dblp',
         }
 
+    @_run_memoized('dblp', key=_search_key)
+    @_cached_lookup('dblp', key=_search_key)
     def verify_via_dblp(self, title: str, rows: int = REVLOOKUP_ROWS) -> Optional[List[Dict]]:
         """Reverse lookup: find candidate publications in DBLP by title query.
 
@@ -639,17 +1435,24 @@ class CitationVerifier:
         if not title:
             return []
         self.log(f"Querying DBLP for: {title[:50]}...")
+        params = {'q': title, 'format': 'json', 'h': rows}
         try:
-            params = {'q': title, 'format': 'json', 'h': rows}
             response = self._http_get("https://dblp.org/search/publ/api", params=params)
-            response.raise_for_status()
-            hits = response.json().get('result', {}).get('hits', {}).get('hit', [])
-            if isinstance(hits, dict):
-                hits = [hits]
-            return [self._candidate_from_dblp_info(h.get('info', {})) for h in hits]
-        except (requests.RequestException, ValueError) as e:
+        except requests.RequestException as e:
+            self.log(f"DBLP search error: {e}")
+            return None
+        if not response.ok:
+            self.log(f"DBLP search error: HTTP {response.status_code}")
+            return None
+        try:
+            data = _json_loads(response.content)
+        except ValueError as e:
             self.log(f"DBLP search error: {e}")
             return None
+        hits = data.get('result', {}).get('hits', {}).get('hit', [])
+        if isinstance(hits, dict):
+            hits = [hits]
+        return [self._candidate_from_dblp_info(h.get('info', {})) for h in hits]
 
     def _candidate_from_openalex_work(self, work: Dict) -> Dict:
         """Map an OpenAlex work object to a normalized candidate dict."""
@@ -657,8 +1460,9 @@ class CitationVerifier:
         for a in work.get('authorships', []) or []:
             name = (a.get('author') or {}).get('display_name')
             if name:
-                authors.append(self.clean_author_name(name))
-                authors_display.append(self.display_author_name(name))
+                display = self.display_author_name(name)
+                authors.append(display.lower())
+                authors_display.append(display)
         src = (work.get('primary_location') or {}).get('source') or {}
         return {
             'title': work.get('display_name'),
@@ -671,6 +1475,8 @@ class CitationVerifier:
             'source': 'openalex',
         }
 
+    @_run_memoized('openalex', key=_search_key)
+    @_cached_lookup('openalex', key=_search_key)
     def verify_via_openalex(self, title: str, rows: int = REVLOOKUP_ROWS) -> Optional[List[Dict]]:
         """Reverse lookup: find candidate works in OpenAlex by title search.
 
@@ -682,7 +1488,7 @@ class CitationVerifier:
             return []
         self.log(f"Querying OpenAlex for: {title[:50]}...")
         # Strip punctuation that would otherwise break the title.search filter syntax.
-        clean = re.sub(r'[^\w\s-]', ' ', title).strip()
+        clean = _OPENALEX_FILTER_UNSAFE.sub(' ', title).strip()
         # 1) Precise title-only search; 2) fall back to broader full-text search when
         #    the title index returns nothing (the confidence gate keeps precision high).
         queries = (
@@ -692,9 +1498,15 @@ class CitationVerifier:
         for params in queries:
             try:
                 response = self._http_get("https://api.openalex.org/works", params=params)
-                response.raise_for_status()
-                results = response.json().get('results', [])
-            except (requests.RequestException, ValueError) as e:
+            except requests.RequestException as e:
+                self.log(f"OpenAlex search error: {e}")
+                return None
+            if not response.ok:
+                self.log(f"OpenAlex search error: HTTP {response.status_code}")
+                return None
+            try:
+                results = _json_loads(response.content).get('results', [])
+            except ValueError as e:
                 self.log(f"OpenAlex search error: {e}")
                 return None
             if results:
@@ -724,11 +1536,16 @@ class CitationVerifier:
         Combines title similarity (gated), author overlap (reusing compare_authors),
         and year proximity into a single confidence in [0, 1].
         """
+        claimed_title = (claimed.get('title') or '').strip().rstrip('.').lower()
+        return self._score_candidate(claimed, claimed_title, candidate)
+
+    def _score_candidate(self, claimed: Dict, claimed_title: str, candidate: Dict) -> Dict:
+        """``score_metadata_match`` with the claimed title already stripped and
+        lower-cased, so ``reverse_lookup`` prepares it once for all candidates."""
         cand_title = (candidate.get('title') or '').strip().rstrip('.')
-        claimed_title = (claimed.get('title') or '').strip().rstrip('.')
         if not cand_title or not claimed_title:
             return {'confidence': 0.0, 'title_sim': 0.0, 'author_ratio': 0.0, 'year_close': 0.0}
-        title_sim = self.similarity_ratio(claimed_title, cand_title)
+        title_sim = self._sim_normalized(claimed_title, cand_title.lower())
         author_cmp = self.compare_authors(claimed.get('authors', []), candidate.get('authors', []))
         author_ratio = author_cmp.get('similarity', 0.0)
         year_close = self._year_proximity(claimed.get('year'), candidate.get('year'))
@@ -758,22 +1575,42 @@ class CitationVerifier:
 
         Returns {status, best, errored, sources_tried} where status is one of
         'matched' | 'ambiguous' | 'not_found' | 'no_title' | 'error'.
+
+        During ``verify_citations`` the CrossRef search is started on the
+        verifier's background executor alongside OpenAlex, so when OpenAlex has
+        no confirmed match the fallback answer is already in flight. That is
+        skipped when the search is already memoized or cached. Sources are still
+        evaluated in order (OpenAlex, CrossRef, DBLP); after an OpenAlex
+        confirmation a CrossRef search that has not started is cancelled, and
+        one already running is left unused (it still lands in the lookup cache).
         """
         title = claimed.get('title')
         if not title:
             return {'status': 'no_title', 'best': None, 'errored': False, 'sources_tried': []}
 
+        claimed_title = title.strip().rstrip('.').lower()
         best = None
         sources_tried = []
         errored = False
-        for source_fn in (self.verify_via_openalex, self.verify_via_crossref_search, self.verify_via_dblp):
-            candidates = source_fn(title)
+        crossref_search = functools.partial(self.verify_via_crossref_search, title)
+        pending = None
+        background = self._background
+        if background is not None and not self._is_known('crossref_search', _search_key(title)):
+            pending = background.submit(crossref_search)
+            crossref_search = pending.result
+        sources = (
+            functools.partial(self.verify_via_openalex, title),
+            crossref_search,
+            functools.partial(self.verify_via_dblp, title),
+        )
+        for fetch in sources:
+            candidates = fetch()
             if candidates is None:
                 errored = True
                 continue
             sources_tried.append(candidates[0]['source'] if candidates else 'searched')
             for cand in candidates:
-                score = self.score_metadata_match(claimed, cand)
+                score = self._score_candidate(claimed, claimed_title, cand)
                 if best is None or score['confidence'] > best['score']['confidence']:
                     best = {
                         'candidate': cand,
@@ -782,7 +1619,9 @@ class CitationVerifier:
                         'confidence': score['confidence'],
                     }
             if best and self._match_is_confirmed(best['score']):
-                break  # confident, corroborated match: stop early to save API calls
+                break  # confident, corroborated match: skip DBLP (and ignore CrossRef)
+        if pending is not None:
+            pending.cancel()  # no-op once it has started or finished
 
         if best and self._match_is_confirmed(best['score']):
             status = 'matched'
@@ -794,6 +1633,45 @@ class CitationVerifier:
             status = 'not_found'
         return {'status': status, 'best': best, 'errored': errored, 'sources_tried': sources_tried}
 
+    def _matching_family_pairs(self, claimed_families, actual_families) -> set:
+        """Return the ``(claimed, actual)`` family-name pairs that fuzzy-match.
+
+        Each distinct pair is scored once (long author lists repeat family names),
+        and identical names skip ``SequenceMatcher`` entirely. Claimed names are
+        bucketed by length: a ratio is ``2*M/(len_a+len_b)`` with ``M <= min(len)``,
+        so lengths whose upper bound is already below the threshold are skipped
+        without scoring — on consortium papers with hundreds of authors this prunes
+        most pairs. One matcher is reused per actual name (``set_seq2`` indexes it
+        once; ``set_seq1`` swaps in each claimed name), keeping the same argument
+        order as ``similarity_ratio(claimed, actual)``. With rapidfuzz installed,
+        pairs whose Indel upper bound is below the threshold skip it as well.
+        """
+        by_length: Dict[int, List[str]] = {}
+        for c_family in claimed_families:
+            by_length.setdefault(len(c_family), []).append(c_family)
+
+        matches = set()
+        matcher = SequenceMatcher()
+        for a_family in actual_families:
+            a_len = len(a_family)
+            indexed = False
+            for c_len, bucket in by_length.items():
+                if 2.0 * min(c_len, a_len) / (c_len + a_len) < LAST_NAME_MATCH_THRESHOLD:
+                    continue
+                for c_family in bucket:
+                    if c_family == a_family:
+                        matches.add((c_family, a_family))
+                        continue
+                    if not _ratio_may_reach(c_family, a_family, LAST_NAME_MATCH_THRESHOLD):
+                        continue
+                    if not indexed:
+                        matcher.set_seq2(a_family)
+                        indexed = True
+                    matcher.set_seq1(c_family)
+                    if matcher.ratio() >= LAST_NAME_MATCH_THRESHOLD:
+                        matches.add((c_family, a_family))
+        return matches
+
     def compare_authors(self, claimed: List[str], actual: List[str]) -> Dict:
         """Structure-aware author comparison.
 
@@ -813,27 +1691,25 @@ class CitationVerifier:
                 'claimed_count': len(claimed) if claimed else 0,
             }
 
-        actual_split = [split_name(a) for a in actual]
+        claimed_split = [split_name(c) for c in claimed]
+        actual_split = [parts for parts in map(split_name, actual) if parts[2]]
+        family_matches = self._matching_family_pairs(
+            {c_family for _, _, c_family in claimed_split},
+            {a_family for _, _, a_family in actual_split},
+        )
 
         per_author_matches = []
-        for claimed_author in claimed:
-            c_given_full, c_initial, c_family = split_name(claimed_author)
-            best = 0.0
-            for a_given_full, a_initial, a_family in actual_split:
-                if not a_family:
-                    continue
-                fam_sim = self.similarity_ratio(c_family, a_family)
-                if fam_sim < LAST_NAME_MATCH_THRESHOLD:
-                    continue
-                if (
+        for _, c_initial, c_family in claimed_split:
+            per_author_matches.append(any(
+                (c_family, a_family) in family_matches
+                and not (
                     GIVEN_INITIAL_MUST_AGREE
                     and c_initial
                     and a_initial
                     and c_initial != a_initial
-                ):
-                    continue
-                best = max(best, fam_sim)
-            per_author_matches.append(best >= LAST_NAME_MATCH_THRESHOLD)
+                )
+                for _, a_initial, a_family in actual_split
+            ))
 
         matched_count = sum(1 for ok in per_author_matches if ok)
         ratio = matched_count / len(per_author_matches)
@@ -858,6 +1734,19 @@ class CitationVerifier:
             'actual': actual,
         }
 
+    def _accept_doi_org_result(self, result: Dict, doi_org_data: Dict) -> None:
+        """Record a DOI confirmed by doi.org (no metadata to compare) on ``result``."""
+        # DOI exists in doi.org system - VALID
+        result['verification']['doi_valid'] = True
+        result['verification']['doi_source'] = 'doi.org'
+        result['actual_data']['doi_org'] = doi_org_data
+        if 'notes' not in result:
+            result['notes'] = []
+        result['notes'].append(
+            "DOI verified via doi.org Handle System (not indexed by CrossRef, e.g., arXiv preprint)"
+        )
+        self.log(f"DOI {result['claimed']['doi']} verified via doi.org")
+
     def verify_citation(self, entry: Dict) -> Dict:
         """
         Perform comprehensive verification of a single citation
@@ -894,9 +1783,19 @@ class CitationVerifier:
             'original_bibtex_fields': entry
         }
 
+        claimed_title = (result['claimed']['title'] or '').lower()
+
         # 1. Verify via DOI (primary method: CrossRef, fallback: doi.org)
         if result['claimed']['doi']:
-            crossref_data = self.verify_via_crossref(result['claimed']['doi'])
+            crossref_data = None
+            if self.registrar_for(result['claimed']['doi']) not in (None, 'Crossref'):
+                # Registered elsewhere (e.g. DataCite): CrossRef would 404, so ask
+                # doi.org first and only fall back to CrossRef if it says no.
+                doi_org_data = self.verify_via_doi_org(result['claimed']['doi'])
+                if doi_org_data and 'error' not in doi_org_data:
+                    self._accept_doi_org_result(result, doi_org_data)
+            if not result['verification']['doi_valid']:
+                crossref_data = self.verify_via_crossref(result['claimed']['doi'])
 
             if crossref_data:
                 if 'error' in crossref_data:
@@ -905,16 +1804,7 @@ class CitationVerifier:
                     doi_org_data = self.verify_via_doi_org(result['claimed']['doi'])
 
                     if doi_org_data and 'error' not in doi_org_data:
-                        # DOI exists in doi.org system - VALID
-                        result['verification']['doi_valid'] = True
-                        result['verification']['doi_source'] = 'doi.org'
-                        result['actual_data']['doi_org'] = doi_org_data
-                        if 'notes' not in result:
-                            result['notes'] = []
-                        result['notes'].append(
-                            "DOI verified via doi.org Handle System (not indexed by CrossRef, e.g., arXiv preprint)"
-                        )
-                        self.log(f"DOI {result['claimed']['doi']} verified via doi.org")
+                        self._accept_doi_org_result(result, doi_org_data)
                     else:
                         # DOI doesn't exist in either system
                         result['verification']['doi_valid'] = False
@@ -940,10 +1830,7 @@ class CitationVerifier:
 
                     # Compare title
                     if crossref_data.get('title'):
-                        title_sim = self.similarity_ratio(
-                            result['claimed']['title'],
-                            crossref_data['title']
-                        )
+                        title_sim = self._sim_normalized(claimed_title, crossref_data['title'].lower())
                         result['verification']['title_match'] = title_sim > 0.8
 
                         if title_sim < 0.8:
@@ -976,12 +1863,10 @@ class CitationVerifier:
             )
             if s2_data and 'error' not in s2_data:
                 result['actual_data']['semantic_scholar'] = s2_data
-                if s2_data.get('title'):
-                    s2_title_sim = self.similarity_ratio(
-                        result['claimed']['title'], s2_data['title']
-                    )
-                    if s2_title_sim >= S2_CONFIRMING_TITLE_THRESHOLD:
-                        s2_confirmed = True
+                if s2_data.get('title') and self._sim_normalized_at_least(
+                    claimed_title, s2_data['title'].lower(), S2_CONFIRMING_TITLE_THRESHOLD
+                ):
+                    s2_confirmed = True
                 if s2_data.get('doi'):
                     s2_doi_norm = normalize_doi(s2_data['doi'])
                     if result['claimed']['doi']:
@@ -1090,6 +1975,71 @@ class CitationVerifier:
 
         return result
 
+    def verify_citations(
+        self,
+        entries: List[Dict],
+        workers: int = 1,
+        progress: Optional[Callable[[int, int, Dict], None]] = None,
+    ) -> List[Dict]:
+        """Verify a batch of entries, overlapping network I/O across worker threads.
+
+        Args:
+            entries (List[Dict]): Parsed BibTeX entries
+            workers (int): Number of entries verified concurrently (1 = serial)
+            progress (Callable): Optional ``progress(count, total, entry)`` hook,
+                called as each entry starts verification; ``count`` runs 1..total
+                in start order and calls never overlap, even with several workers
+
+        Returns:
+            List[Dict]: Verification results, in the same order as ``entries``;
+                duplicate entries (see ``entry_verification_key``) are verified
+                once and get a copy of that result
+        """
+        keys = [entry_verification_key(entry) for entry in entries]
+        unique = {}
+        for key, entry in zip(keys, entries):
+            unique.setdefault(key, entry)
+        unique_entries = list(unique.values())
+        total = len(unique_entries)
+        started = 0
+        started_lock = threading.Lock()
+
+        def run(entry):
+            nonlocal started
+            if progress:
+                # Number entries in start order and keep hook output unbroken
+                with started_lock:
+                    started += 1
+                    progress(started, total, entry)
+            return self.verify_citation(entry)
+
+        self.prefetch_crossref(unique_entries)
+
+        # One background slot per worker, shared by every entry in the batch
+        self._background = ThreadPoolExecutor(max_workers=max(workers, 1))
+        try:
+            if workers <= 1 or total <= 1:
+                verified = [run(entry) for entry in unique_entries]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    verified = list(pool.map(run, unique_entries))
+        finally:
+            background, self._background = self._background, None
+            background.shutdown()
+        verified = dict(zip(unique, verified))
+
+        results = []
+        for key, entry in zip(keys, entries):
+            result = verified[key]
+            source = result['original_bibtex_fields']
+            if source is not entry:
+                # Copy the shared result, swapping in this entry's own fields
+                result = copy.deepcopy(result, {id(source): entry})
+                result['key'] = entry.get('key')
+                result['type'] = entry.get('type')
+            results.append(result)
+        return results
+
 
 def generate_fix_suggestions(result: Dict) -> Dict:
     """
@@ -1151,41 +2101,77 @@ def generate_fix_suggestions(result: Dict) -> Dict:
     return fixes
 
 
-def reconstruct_bibtex_entry(result: Dict, fixes: Dict) -> str:
-    """
-    Reconstruct BibTeX entry preserving original fields, applying fixes
-
-    Args:
-        result (Dict): Verification result
-        fixes (Dict): Fix suggestions
-
-    Returns:
-        str: Corrected BibTeX entry
-    """
-    original_entry = result.get('original_bibtex_fields', {})
-    lines = [f"@{result['type']}{{{result['key']},"]
-
-    # Define standard BibTeX field order
-    field_order = [
-        'author', 'title', 'booktitle', 'journal', 'year', 'month',
-        'volume', 'number', 'pages', 'publisher', 'address', 'organization',
-        'editor', 'series', 'edition', 'chapter', 'note', 'doi', 'url',
-        'isbn', 'issn', 'eprint', 'archivePrefix', 'primaryClass'
-    ]
+# Report presentation per status: (emoji, shields.io badge color, severity)
+STATUS_META: Dict[str, Tuple[str, str, str]] = {
+    'FABRICATED': ('❌', 'red', 'CRITICAL'),
+    'DOI_INVALID': ('❌', 'red', 'CRITICAL'),
+    'SUSPICIOUS': ('🔍', 'orange', 'HIGH'),
+    'WARNING': ('⚠️', 'yellow', 'MEDIUM'),
+    'NOT_FOUND': ('🔎', 'orange', 'MEDIUM'),
+    'AMBIGUOUS': ('🟡', 'yellow', 'REVIEW'),
+    'UNVERIFIED': ('❓', 'lightgrey', 'REVIEW'),
+    'MATCHED': ('🟢', 'brightgreen', 'OK'),
+    'VERIFIED': ('✅', 'green', 'OK'),
+}
+
+# Every overall_status, most severe first; reports and the CLI summary list statuses in this order
+STATUS_ORDER: Tuple[str, ...] = tuple(STATUS_META)
+
+
+# Static "About This Report" block closing every Markdown report
+_MD_FOOTER_TEMPLATE = (
+    "---\n"
+    "\n"
+    "## About This Report\n"
+    "\n"
+    "Generated by **Citation DOI Validator** - Academic Citation Verification Tool\n"
+    "\n"
+    "- ✅ Validates DOIs via CrossRef API\n"
+    "- ✅ Verifies author names against academic databases\n"
+    "- ✅ Checks publication metadata (title, year, venue)\n"
+    "- ✅ Uses fuzzy matching to detect variations\n"
+    "- ✅ Cross-references with Semantic Scholar\n"
+    "- ✅ Recovers DOI-less entries via OpenAlex, DBLP, and CrossRef reverse lookup (MATCHED / AMBIGUOUS / NOT_FOUND)\n"
+    "\n"
+    f"**Version:** {__version__}  \n"
+    "**Repository:** https://github.com/lnm8910/citation-doi-validator  \n"
+    "**Generated:** {generated}  \n"
+    "**Total Citations Analyzed:** {total}\n"
+)
+
+
+# Standard BibTeX field order for reconstructed entries; other fields follow sorted
+BIBTEX_FIELD_ORDER = (
+    'author', 'title', 'booktitle', 'journal', 'year', 'month',
+    'volume', 'number', 'pages', 'publisher', 'address', 'organization',
+    'editor', 'series', 'edition', 'chapter', 'note', 'doi', 'url',
+    'isbn', 'issn', 'eprint', 'archivePrefix', 'primaryClass'
+)
+_BIBTEX_FIELD_ORDER_SET = frozenset(BIBTEX_FIELD_ORDER)
+
+
+def _bibtex_author_field(authors: List[str]) -> str:
+    """Join display names ("Given Family") into a BibTeX "Family, Given and ..." field"""
+    parts = []
+    for a in authors:
+        tokens = a.split()
+        parts.append(f"{tokens[-1]}, {' '.join(tokens[:-1])}" if len(tokens) > 1 else a)
+    return ' and '.join(parts)
+
+
+def _bibtex_entry_lines(result: Dict, fixes: Dict):
+    """Yield the lines of the corrected BibTeX entry for reconstruct_bibtex_entry"""
+    yield f"@{result['type']}{{{result['key']},"
 
     # Build fields dict
     fields = {}
-    for key, value in original_entry.items():
-        if key not in ['type', 'key']:
+    for key, value in result.get('original_bibtex_fields', {}).items():
+        if key not in ('type', 'key'):
             fields[key.lower()] = value
 
     # Apply fixes (override original values)
     if fixes.get('suggested_authors'):
-        author_str = ' and '.join([
-            f"{a.split()[-1]}, {' '.join(a.split()[:-1])}" if len(a.split()) > 1 else a
-            for a in fixes['suggested_authors']
-        ])
-        fields['author'] = author_str
+        fields['author'] = _bibtex_author_field(fixes['suggested_authors'])
 
     if fixes.get('suggested_title'):
         fields['title'] = fixes['suggested_title']
@@ -1196,438 +2182,541 @@ def reconstruct_bibtex_entry(result: Dict, fixes: Dict) -> str:
     if fixes.get('suggested_doi'):
         fields['doi'] = fixes['suggested_doi']
 
-    # Add fields in standard order
-    for field_name in field_order:
+    # Fields in standard order, then the remaining fields sorted by name
+    for field_name in BIBTEX_FIELD_ORDER:
         if field_name in fields:
-            value = fields[field_name]
-            lines.append(f"  {field_name} = {{{value}}},")
-            del fields[field_name]
+            yield f"  {field_name} = {{{fields[field_name]}}},"
 
-    # Add remaining fields
     for field_name, value in sorted(fields.items()):
-        lines.append(f"  {field_name} = {{{value}}},")
+        if field_name not in _BIBTEX_FIELD_ORDER_SET:
+            yield f"  {field_name} = {{{value}}},"
 
-    lines.append("}")
-    return '\n'.join(lines)
+    yield "}"
 
 
-def generate_markdown_report(results: List[Dict]) -> str:
+def reconstruct_bibtex_entry(result: Dict, fixes: Dict) -> str:
+    """
+    Reconstruct BibTeX entry preserving original fields, applying fixes
+
+    Args:
+        result (Dict): Verification result
+        fixes (Dict): Fix suggestions
+
+    Returns:
+        str: Corrected BibTeX entry
+    """
+    return '\n'.join(_bibtex_entry_lines(result, fixes))
+
+
+def report_timestamp() -> str:
+    """Current local time in the format printed in report headers and footers"""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+@dataclass(frozen=True)
+class ReportStats:
+    """Summary statistics shared by the reports and the CLI summary.
+
+    Built once per run by ``compute_stats``. ``by_status`` keeps each status's
+    results in input order; ``counts`` is a ``Counter``, so absent statuses
+    count as 0.
+    """
+    by_status: Dict[str, List[Dict]]
+    counts: Counter
+    total: int
+
+    def results_for(self, status: str) -> List[Dict]:
+        """Results with the given status (empty list if none)."""
+        return self.by_status.get(status, [])
+
+    @property
+    def fabricated(self) -> List[Dict]:
+        return self.results_for('FABRICATED')
+
+    @property
+    def invalid_doi(self) -> List[Dict]:
+        return self.results_for('DOI_INVALID')
+
+
+def compute_stats(results: List[Dict]) -> ReportStats:
+    """Group verification results by ``overall_status`` in one pass and count them"""
+    groups = defaultdict(list)
+    for r in results:
+        groups[r['verification']['overall_status']].append(r)
+    by_status = dict(groups)
+    counts = Counter({status: len(rs) for status, rs in by_status.items()})
+    return ReportStats(by_status=by_status, counts=counts, total=len(results))
+
+
+def generate_markdown_report(
+    results: List[Dict],
+    stats: Optional[ReportStats] = None,
+    timestamp: Optional[str] = None,
+) -> str:
     """
     Generate comprehensive Markdown verification report
 
     Args:
         results (List[Dict]): List of verification results
+        stats (ReportStats): Optional precomputed ``compute_stats(results)``
+        timestamp (str): Optional "Generated" time (default: ``report_timestamp()``)
 
     Returns:
         str: Markdown-formatted report
     """
-    status_emoji = {
-        'VERIFIED': '✅',
-        'MATCHED': '🟢',
-        'UNVERIFIED': '❓',
-        'AMBIGUOUS': '🟡',
-        'NOT_FOUND': '🔎',
-        'WARNING': '⚠️',
-        'SUSPICIOUS': '🔍',
-        'FABRICATED': '❌',
-        'DOI_INVALID': '❌'
-    }
+    buf = io.StringIO()
+    write_markdown_report(results, buf, stats, timestamp)
+    return buf.getvalue()
 
-    # Calculate statistics
-    statuses = {}
-    for r in results:
-        status = r['verification']['overall_status']
-        statuses[status] = statuses.get(status, 0) + 1
-
-    lines = [
-        "# Citation Verification Report",
-        "",
-        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  ",
-        f"**Total Citations Verified:** {len(results)}",
-        "",
-        "---",
-        "",
-        "## Executive Summary",
-        ""
-    ]
+
+def write_markdown_report(
+    results: List[Dict],
+    out: TextIO,
+    stats: Optional[ReportStats] = None,
+    timestamp: Optional[str] = None,
+) -> None:
+    """
+    Write the Markdown verification report to a text stream
+
+    Sections are written as they are produced, so a report for thousands of
+    citations can go straight to a file without being held in memory.
+
+    Args:
+        results (List[Dict]): List of verification results
+        out (TextIO): Destination stream (file, ``sys.stdout``, ``io.StringIO``)
+        stats (ReportStats): Optional precomputed ``compute_stats(results)``,
+            so a caller that already has it skips another pass
+        timestamp (str): Optional "Generated" time for the header and footer
+            (default: ``report_timestamp()``, taken once per report)
+    """
+    w = out.write
+    if timestamp is None:
+        timestamp = report_timestamp()
+
+    if stats is None:
+        stats = compute_stats(results)
+    statuses = stats.counts
+
+    w(
+        "# Citation Verification Report\n"
+        "\n"
+        f"**Generated:** {timestamp}  \n"
+        f"**Total Citations Verified:** {len(results)}\n"
+        "\n"
+        "---\n"
+        "\n"
+        "## Executive Summary\n"
+        "\n"
+    )
 
     # Summary table
-    lines.extend([
-        "| Status | Count | Percentage | Severity |",
-        "|--------|-------|------------|----------|"
-    ])
-
-    status_order = ['FABRICATED', 'DOI_INVALID', 'SUSPICIOUS', 'WARNING', 'NOT_FOUND', 'AMBIGUOUS', 'UNVERIFIED', 'MATCHED', 'VERIFIED']
-    for status in status_order:
-        count = statuses.get(status, 0)
+    w(
+        "| Status | Count | Percentage | Severity |\n"
+        "|--------|-------|------------|----------|\n"
+    )
+
+    for status in STATUS_ORDER:
+        count = statuses[status]
         if count > 0:
-            percentage = (count / len(results)) * 100
-            emoji = status_emoji.get(status, '•')
-            severity = 'CRITICAL' if status in ['FABRICATED', 'DOI_INVALID'] else \
-                      'HIGH' if status == 'SUSPICIOUS' else \
-                      'MEDIUM' if status in ['WARNING', 'NOT_FOUND'] else \
-                      'REVIEW' if status in ['AMBIGUOUS', 'UNVERIFIED'] else 'OK'
-            lines.append(f"| {emoji} **{status}** | {count} | {percentage:.1f}% | {severity} |")
+            percentage = (count / stats.total) * 100
+            emoji, _, severity = STATUS_META[status]
+            w(f"| {emoji} **{status}** | {count} | {percentage:.1f}% | {severity} |\n")
 
-    lines.extend(["", "---", ""])
+    w("\n---\n\n")
 
     # Key findings
-    fabricated = [r for r in results if r['verification']['overall_status'] == 'FABRICATED']
-    invalid_doi = [r for r in results if r['verification']['overall_status'] == 'DOI_INVALID']
-    suspicious = [r for r in results if r['verification']['overall_status'] == 'SUSPICIOUS']
-    not_found = [r for r in results if r['verification']['overall_status'] == 'NOT_FOUND']
-    ambiguous = [r for r in results if r['verification']['overall_status'] == 'AMBIGUOUS']
-    unverified = [r for r in results if r['verification']['overall_status'] == 'UNVERIFIED']
-    matched = [r for r in results if r['verification']['overall_status'] == 'MATCHED']
+    fabricated = stats.fabricated
+    invalid_doi = stats.invalid_doi
+    suspicious = stats.results_for('SUSPICIOUS')
+    not_found = stats.results_for('NOT_FOUND')
+    ambiguous = stats.results_for('AMBIGUOUS')
+    unverified = stats.results_for('UNVERIFIED')
+    matched = stats.results_for('MATCHED')
 
-    lines.append("## Key Findings")
-    lines.append("")
+    w("## Key Findings\n\n")
 
     if fabricated:
-        lines.append(f"🚨 **{len(fabricated)} FABRICATED citations detected** - Authors do not match actual papers")
+        w(f"🚨 **{len(fabricated)} FABRICATED citations detected** - Authors do not match actual papers\n")
     if invalid_doi:
-        lines.append(f"🚫 **{len(invalid_doi)} INVALID DOIs** - Citations reference non-existent papers")
+        w(f"🚫 **{len(invalid_doi)} INVALID DOIs** - Citations reference non-existent papers\n")
     if suspicious:
-        lines.append(f"⚠️ **{len(suspicious)} SUSPICIOUS citations** - Multiple discrepancies found")
+        w(f"⚠️ **{len(suspicious)} SUSPICIOUS citations** - Multiple discrepancies found\n")
     if not_found:
-        lines.append(f"🔎 **{len(not_found)} NOT_FOUND** - No matching record located in DBLP or CrossRef by title")
+        w(f"🔎 **{len(not_found)} NOT_FOUND** - No matching record located in DBLP or CrossRef by title\n")
     if ambiguous:
-        lines.append(f"🟡 **{len(ambiguous)} AMBIGUOUS** - A possible match was found but not corroborated; manual check recommended")
+        w(f"🟡 **{len(ambiguous)} AMBIGUOUS** - A possible match was found but not corroborated; manual check recommended\n")
     if unverified:
-        lines.append(f"❓ **{len(unverified)} UNVERIFIED citations** - Could not confirm against any authoritative source")
+        w(f"❓ **{len(unverified)} UNVERIFIED citations** - Could not confirm against any authoritative source\n")
     if matched:
-        lines.append(f"🟢 **{len(matched)} MATCHED** - No DOI in the entry, but confirmed via DBLP/CrossRef metadata (DOI recoverable)")
+        w(f"🟢 **{len(matched)} MATCHED** - No DOI in the entry, but confirmed via DBLP/CrossRef metadata (DOI recoverable)\n")
 
-    verified_count = statuses.get('VERIFIED', 0)
+    verified_count = statuses['VERIFIED']
     if verified_count > 0:
-        lines.append(f"✅ **{verified_count} citations verified** as authentic")
+        w(f"✅ **{verified_count} citations verified** as authentic\n")
 
     total_issues = len(fabricated) + len(invalid_doi) + len(suspicious)
     fraud_rate = (total_issues / len(results)) * 100 if results else 0
-    lines.extend([
-        "",
-        f"**Overall Fraud/Error Rate:** {fraud_rate:.1f}%",
-        "",
-        "---",
-        ""
-    ])
+    w(
+        "\n"
+        f"**Overall Fraud/Error Rate:** {fraud_rate:.1f}%\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
 
     # Detailed findings by status
-    lines.append("## Detailed Findings")
-    lines.append("")
+    w("## Detailed Findings\n\n")
 
-    for status in status_order:
-        status_results = [r for r in results if r['verification']['overall_status'] == status]
+    for status in STATUS_ORDER:
+        status_results = stats.results_for(status)
 
         if not status_results:
             continue
 
-        emoji = status_emoji.get(status, '•')
-        lines.extend([
-            f"### {emoji} {status} ({len(status_results)} citations)",
-            ""
-        ])
+        emoji, badge_color, _ = STATUS_META[status]
+        w(f"### {emoji} {status} ({len(status_results)} citations)\n\n")
+
+        # Status badge (same for every citation in this group)
+        badge_status = status.replace('_', '__')
+        badge = f"![Status](https://img.shields.io/badge/Status-{badge_status}-{badge_color})\n\n"
 
         for idx, r in enumerate(status_results, 1):
-            lines.extend([
-                f"#### {idx}. `{r['key']}`",
-                ""
-            ])
-
-            # Status badge
-            badge_status = status.replace('_', '__')
-            badge_color = 'red' if status in ['FABRICATED', 'DOI_INVALID'] else \
-                         'orange' if status in ['SUSPICIOUS', 'NOT_FOUND'] else \
-                         'yellow' if status in ['WARNING', 'AMBIGUOUS'] else \
-                         'lightgrey' if status == 'UNVERIFIED' else \
-                         'brightgreen' if status == 'MATCHED' else 'green'
-            lines.append(f"![Status](https://img.shields.io/badge/Status-{badge_status}-{badge_color})")
-            lines.append("")
+            w(f"#### {idx}. `{r['key']}`\n\n")
+            w(badge)
 
             # Claimed information — prefer display-cased names when present
-            claimed_authors_disp = r['claimed'].get('authors_display') or r['claimed']['authors']
-            lines.extend([
-                "**Claimed Information:**",
-                "",
-                f"- **Title:** {r['claimed']['title']}",
-                f"- **Authors:** {', '.join(claimed_authors_disp[:5])}"
-            ])
+            claimed = r['claimed']
+            claimed_authors_disp = claimed.get('authors_display') or claimed['authors']
+            w(
+                "**Claimed Information:**\n"
+                "\n"
+                f"- **Title:** {claimed['title']}\n"
+                f"- **Authors:** {', '.join(claimed_authors_disp[:5])}\n"
+            )
 
             if len(claimed_authors_disp) > 5:
-                lines.append(f"  - *(+{len(claimed_authors_disp) - 5} more authors)*")
-
-            lines.extend([
-                f"- **Year:** {r['claimed']['year']}",
-                f"- **DOI:** `{r['claimed']['doi'] or 'N/A'}`",
-                f"- **Venue:** {r['claimed']['venue']}",
-                f"- **Type:** {r['type']}",
-                ""
-            ])
+                w(f"  - *(+{len(claimed_authors_disp) - 5} more authors)*\n")
+
+            w(
+                f"- **Year:** {claimed['year']}\n"
+                f"- **DOI:** `{claimed['doi'] or 'N/A'}`\n"
+                f"- **Venue:** {claimed['venue']}\n"
+                f"- **Type:** {r['type']}\n"
+                "\n"
+            )
 
             # Issues
             if r['issues']:
-                lines.extend([
-                    "**⚠️ Issues Detected:**",
-                    ""
-                ])
-                for issue in r['issues']:
-                    lines.append(f"- 🔴 {issue}")
-                lines.append("")
+                w("**⚠️ Issues Detected:**\n\n")
+                w("".join(f"- 🔴 {issue}\n" for issue in r['issues']))
+                w("\n")
 
             # Notes (informational)
             if r.get('notes'):
-                lines.extend([
-                    "**ℹ️ Notes:**",
-                    ""
-                ])
-                for note in r['notes']:
-                    lines.append(f"- 📝 {note}")
-                lines.append("")
+                w("**ℹ️ Notes:**\n\n")
+                w("".join(f"- 📝 {note}\n" for note in r['notes']))
+                w("\n")
 
             # Actual data comparison
             if r['actual_data'].get('crossref'):
                 cf = r['actual_data']['crossref']
                 if 'error' not in cf:
                     actual_authors_disp = cf.get('authors_display') or cf.get('authors', [])
-                    lines.extend([
-                        "<details>",
-                        "<summary><b>Actual Information (from CrossRef)</b></summary>",
-                        "",
-                        f"- **Title:** {cf.get('title', 'N/A')}",
-                        f"- **Authors:** {', '.join(actual_authors_disp[:5])}"
-                    ])
+                    w(
+                        "<details>\n"
+                        "<summary><b>Actual Information (from CrossRef)</b></summary>\n"
+                        "\n"
+                        f"- **Title:** {cf.get('title', 'N/A')}\n"
+                        f"- **Authors:** {', '.join(actual_authors_disp[:5])}\n"
+                    )
 
                     if len(actual_authors_disp) > 5:
-                        lines.append(f"  - *(+{len(actual_authors_disp) - 5} more authors)*")
-
-                    lines.extend([
-                        f"- **Year:** {cf.get('year', 'N/A')}",
-                        f"- **DOI:** `{cf.get('doi', 'N/A')}`",
-                        f"- **Venue:** {cf.get('venue', 'N/A')}",
-                        "",
-                        "</details>",
-                        ""
-                    ])
+                        w(f"  - *(+{len(actual_authors_disp) - 5} more authors)*\n")
+
+                    w(
+                        f"- **Year:** {cf.get('year', 'N/A')}\n"
+                        f"- **DOI:** `{cf.get('doi', 'N/A')}`\n"
+                        f"- **Venue:** {cf.get('venue', 'N/A')}\n"
+                        "\n"
+                        "</details>\n"
+                        "\n"
+                    )
 
             # Closest match from a metadata reverse-lookup (DBLP / CrossRef search)
             mm = r['actual_data'].get('metadata_match')
             if mm:
-                lines.extend([
-                    "<details>",
+                w(
+                    "<details>\n"
                     f"<summary><b>Closest match (from {mm.get('source', 'index')}, "
-                    f"confidence {mm.get('confidence')})</b></summary>",
-                    "",
-                    f"- **Title:** {mm.get('title', 'N/A')}",
-                    f"- **Authors:** {', '.join((mm.get('authors') or [])[:5])}",
-                    f"- **Year:** {mm.get('year', 'N/A')}",
-                    f"- **DOI:** `{mm.get('doi') or 'N/A'}`",
-                    f"- **Venue:** {mm.get('venue', 'N/A')}",
-                    "",
-                    "</details>",
-                    ""
-                ])
+                    f"confidence {mm.get('confidence')})</b></summary>\n"
+                    "\n"
+                    f"- **Title:** {mm.get('title', 'N/A')}\n"
+                    f"- **Authors:** {', '.join((mm.get('authors') or [])[:5])}\n"
+                    f"- **Year:** {mm.get('year', 'N/A')}\n"
+                    f"- **DOI:** `{mm.get('doi') or 'N/A'}`\n"
+                    f"- **Venue:** {mm.get('venue', 'N/A')}\n"
+                    "\n"
+                    "</details>\n"
+                    "\n"
+                )
 
             # Generate and display fix suggestions (also for DOIs recovered on DOI-less entries)
             if r['issues'] or r.get('verification', {}).get('recovered_doi'):
                 fixes = generate_fix_suggestions(r)
 
                 if fixes['has_fixes']:
-                    lines.extend([
-                        "### 🔧 Suggested Fixes",
-                        ""
-                    ])
+                    w("### 🔧 Suggested Fixes\n\n")
 
                     if fixes['suggested_authors']:
-                        lines.extend([
-                            "**Corrected Authors:**",
-                            "```"
-                        ])
-                        lines.append(', '.join(fixes['suggested_authors'][:10]))
+                        w("**Corrected Authors:**\n```\n")
+                        w(', '.join(fixes['suggested_authors'][:10]) + "\n")
                         if len(fixes['suggested_authors']) > 10:
-                            lines.append(f"... (+{len(fixes['suggested_authors']) - 10} more)")
-                        lines.extend(["```", ""])
+                            w(f"... (+{len(fixes['suggested_authors']) - 10} more)\n")
+                        w("```\n\n")
 
                     if fixes['suggested_doi']:
-                        lines.append(f"**Corrected DOI:** `{fixes['suggested_doi']}`  ")
+                        w(f"**Corrected DOI:** `{fixes['suggested_doi']}`  \n")
                     if fixes['suggested_title']:
-                        lines.append(f"**Corrected Title:** {fixes['suggested_title']}  ")
+                        w(f"**Corrected Title:** {fixes['suggested_title']}  \n")
                     if fixes['suggested_year']:
-                        lines.append(f"**Corrected Year:** {fixes['suggested_year']}  ")
+                        w(f"**Corrected Year:** {fixes['suggested_year']}  \n")
 
                     # Show corrected BibTeX entry
                     if fixes['bibtex_entry']:
-                        lines.extend([
-                            "",
-                            "<details>",
-                            "<summary><b>📋 Copy-Paste Corrected BibTeX Entry</b></summary>",
-                            "",
-                            "Replace the entry in `references.bib` with this corrected version:",
-                            "",
-                            "```bibtex",
-                            fixes['bibtex_entry'],
-                            "```",
-                            "",
-                            "</details>",
-                            ""
-                        ])
-
-            lines.extend(["---", ""])
+                        w(
+                            "\n"
+                            "<details>\n"
+                            "<summary><b>📋 Copy-Paste Corrected BibTeX Entry</b></summary>\n"
+                            "\n"
+                            "Replace the entry in `references.bib` with this corrected version:\n"
+                            "\n"
+                            "```bibtex\n"
+                            f"{fixes['bibtex_entry']}\n"
+                            "```\n"
+                            "\n"
+                            "</details>\n"
+                            "\n"
+                        )
+
+            w("---\n\n")
 
     # Recommendations
-    lines.extend(["## Recommendations", ""])
+    w("## Recommendations\n\n")
 
     if fabricated:
-        lines.extend([
-            "### 🚨 Critical Actions Required",
-            "",
-            "The following citations have **fabricated author information**:",
-            ""
-        ])
-        for r in fabricated:
-            lines.append(f"- `{r['key']}` - {r['claimed']['title'][:80]}...")
-        lines.extend([
-            "",
-            "**Action:** These citations must be corrected or removed immediately.",
-            ""
-        ])
+        w(
+            "### 🚨 Critical Actions Required\n"
+            "\n"
+            "The following citations have **fabricated author information**:\n"
+            "\n"
+        )
+        w("".join(f"- `{r['key']}` - {r['claimed']['title'][:80]}...\n" for r in fabricated))
+        w(
+            "\n"
+            "**Action:** These citations must be corrected or removed immediately.\n"
+            "\n"
+        )
 
     if invalid_doi:
-        lines.extend([
-            "### 🚫 Invalid DOI References",
-            "",
-            "The following citations have DOIs that do not exist:",
-            ""
-        ])
-        for r in invalid_doi:
-            lines.append(f"- `{r['key']}` - DOI: `{r['claimed']['doi']}`")
-        lines.extend([
-            "",
-            "**Action:** Verify these DOIs are correct or find alternative references.",
-            ""
-        ])
-
-    # Footer
-    lines.extend([
-        "---",
-        "",
-        "## About This Report",
-        "",
-        "Generated by **Citation DOI Validator** - Academic Citation Verification Tool",
-        "",
-        "- ✅ Validates DOIs via CrossRef API",
-        "- ✅ Verifies author names against academic databases",
-        "- ✅ Checks publication metadata (title, year, venue)",
-        "- ✅ Uses fuzzy matching to detect variations",
-        "- ✅ Cross-references with Semantic Scholar",
-        "- ✅ Recovers DOI-less entries via OpenAlex, DBLP, and CrossRef reverse lookup (MATCHED / AMBIGUOUS / NOT_FOUND)",
-        "",
-        f"**Version:** {__version__}  ",
-        f"**Repository:** https://github.com/lnm8910/citation-doi-validator  ",
-        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  ",
-        f"**Total Citations Analyzed:** {len(results)}",
-        ""
-    ])
-
-    return "\n".join(lines)
-
-
-def generate_text_report(results: List[Dict]) -> str:
-    """Generate plain text verification report"""
-    report_lines = [
-        "=" * 80,
-        "CITATION VERIFICATION REPORT",
-        "=" * 80,
-        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"Total Citations Verified: {len(results)}",
-        ""
-    ]
-
-    # Summary statistics
-    statuses = {}
-    for r in results:
-        status = r['verification']['overall_status']
-        statuses[status] = statuses.get(status, 0) + 1
+        w(
+            "### 🚫 Invalid DOI References\n"
+            "\n"
+            "The following citations have DOIs that do not exist:\n"
+            "\n"
+        )
+        w("".join(f"- `{r['key']}` - DOI: `{r['claimed']['doi']}`\n" for r in invalid_doi))
+        w(
+            "\n"
+            "**Action:** Verify these DOIs are correct or find alternative references.\n"
+            "\n"
+        )
+
+    # Footer (no trailing newline, matching the historical "\n".join output)
+    w(_MD_FOOTER_TEMPLATE.format(
+        generated=timestamp,
+        total=len(results),
+    ))
+
 
-    report_lines.extend([
-        "SUMMARY:",
-        "-" * 80
-    ])
+def generate_text_report(
+    results: List[Dict],
+    stats: Optional[ReportStats] = None,
+    timestamp: Optional[str] = None,
+) -> str:
+    """Generate plain text verification report"""
+    buf = io.StringIO()
+    write_text_report(results, buf, stats, timestamp)
+    return buf.getvalue()
+
+
+def write_text_report(
+    results: List[Dict],
+    out: TextIO,
+    stats: Optional[ReportStats] = None,
+    timestamp: Optional[str] = None,
+) -> None:
+    """Write the plain text verification report to a text stream.
+
+    Every line after the first is written with its leading newline, so the
+    output has no trailing newline (as with the historical ``"\\n".join``).
+    ``stats`` is an optional precomputed ``compute_stats(results)`` and
+    ``timestamp`` an optional "Generated" time (default: ``report_timestamp()``).
+    """
+    w = out.write
+    if timestamp is None:
+        timestamp = report_timestamp()
+    rule = "=" * 80
+    thin_rule = "-" * 80
+
+    # Summary statistics (the groups are reused for the detailed findings)
+    if stats is None:
+        stats = compute_stats(results)
+
+    w(
+        f"{rule}\n"
+        "CITATION VERIFICATION REPORT\n"
+        f"{rule}\n"
+        f"Generated: {timestamp}\n"
+        f"Total Citations Verified: {len(results)}\n"
+        "\n"
+        "SUMMARY:\n"
+        f"{thin_rule}"
+    )
 
-    for status, count in sorted(statuses.items()):
-        percentage = (count / len(results)) * 100
-        report_lines.append(f"  {status:15s}: {count:3d} ({percentage:5.1f}%)")
+    counts = stats.counts
+    w("".join(
+        f"\n  {status:15s}: {counts[status]:3d} ({counts[status] / stats.total * 100:5.1f}%)"
+        for status in STATUS_ORDER if counts[status]
+    ))
 
-    report_lines.extend(["", "=" * 80, "DETAILED FINDINGS:", "=" * 80, ""])
+    w(f"\n\n{rule}\nDETAILED FINDINGS:\n{rule}\n")
 
     # Detailed findings
-    for status in ['FABRICATED', 'DOI_INVALID', 'SUSPICIOUS', 'WARNING', 'NOT_FOUND', 'AMBIGUOUS', 'UNVERIFIED', 'MATCHED', 'VERIFIED']:
-        status_results = [r for r in results if r['verification']['overall_status'] == status]
+    for status in STATUS_ORDER:
+        status_results = stats.results_for(status)
 
         if not status_results:
             continue
 
-        report_lines.append(f"\n{status} ({len(status_results)} citations)")
-        report_lines.append('=' * 80)
+        w(f"\n\n{status} ({len(status_results)} citations)\n{rule}")
 
         for r in status_results:
-            report_lines.extend([
-                f"\n[{r['key']}]",
-                f"Type: {r['type']}",
-                f"Status: {r['verification']['overall_status']}",
-                ""
-            ])
-
-            report_lines.append("CLAIMED:")
-            report_lines.append(f"  Title: {r['claimed']['title'][:100]}")
-            report_lines.append(f"  Authors: {', '.join(r['claimed']['authors'][:3])}")
-            if len(r['claimed']['authors']) > 3:
-                report_lines.append(f"           (+{len(r['claimed']['authors']) - 3} more)")
-            report_lines.append(f"  Year: {r['claimed']['year']}")
-            report_lines.append(f"  DOI: {r['claimed']['doi']}")
-            report_lines.append(f"  Venue: {r['claimed']['venue'][:60]}")
-            report_lines.append("")
+            claimed = r['claimed']
+            w(
+                f"\n\n[{r['key']}]\n"
+                f"Type: {r['type']}\n"
+                f"Status: {r['verification']['overall_status']}\n"
+                "\n"
+                "CLAIMED:\n"
+                f"  Title: {claimed['title'][:100]}\n"
+                f"  Authors: {', '.join(claimed['authors'][:3])}"
+            )
+            if len(claimed['authors']) > 3:
+                w(f"\n           (+{len(claimed['authors']) - 3} more)")
+            w(
+                f"\n  Year: {claimed['year']}\n"
+                f"  DOI: {claimed['doi']}\n"
+                f"  Venue: {claimed['venue'][:60]}\n"
+            )
 
             if r['issues']:
-                report_lines.append("ISSUES:")
-                for issue in r['issues']:
-                    report_lines.append(f"  ⚠ {issue}")
-                report_lines.append("")
+                w("\nISSUES:")
+                w("".join(f"\n  ⚠ {issue}" for issue in r['issues']))
+                w("\n")
 
             if r['actual_data'].get('crossref'):
                 cf = r['actual_data']['crossref']
                 if 'error' not in cf:
-                    report_lines.append("ACTUAL (from CrossRef):")
-                    report_lines.append(f"  Title: {cf.get('title', 'N/A')[:100]}")
                     authors = cf.get('authors', [])
-                    report_lines.append(f"  Authors: {', '.join(authors[:3])}")
+                    w(
+                        "\nACTUAL (from CrossRef):\n"
+                        f"  Title: {cf.get('title', 'N/A')[:100]}\n"
+                        f"  Authors: {', '.join(authors[:3])}"
+                    )
                     if len(authors) > 3:
-                        report_lines.append(f"           (+{len(authors) - 3} more)")
-                    report_lines.append(f"  Year: {cf.get('year', 'N/A')}")
-                    report_lines.append(f"  DOI: {cf.get('doi', 'N/A')}")
-                    report_lines.append("")
-
-            report_lines.append("-" * 80)
+                        w(f"\n           (+{len(authors) - 3} more)")
+                    w(
+                        f"\n  Year: {cf.get('year', 'N/A')}\n"
+                        f"  DOI: {cf.get('doi', 'N/A')}\n"
+                    )
 
-    return "\n".join(report_lines)
+            w(f"\n{thin_rule}")
 
 
-def generate_report(results: List[Dict], output_format='markdown') -> str:
+def generate_report(
+    results: List[Dict],
+    output_format='markdown',
+    stats: Optional[ReportStats] = None,
+    timestamp: Optional[str] = None,
+) -> str:
     """
     Generate verification report in specified format
 
     Args:
         results (List[Dict]): Verification results
         output_format (str): Output format ('text', 'json', 'markdown')
+        stats (ReportStats): Optional precomputed ``compute_stats(results)``
+        timestamp (str): Optional "Generated" time (default: ``report_timestamp()``)
 
     Returns:
         str: Formatted report
     """
+    buf = io.StringIO()
+    write_report(results, buf, output_format=output_format, stats=stats, timestamp=timestamp)
+    return buf.getvalue()
+
+
+def write_report(
+    results: List[Dict],
+    out: TextIO,
+    output_format='markdown',
+    stats: Optional[ReportStats] = None,
+    timestamp: Optional[str] = None,
+) -> None:
+    """
+    Write verification report in specified format to a text stream
+
+    The report is written incrementally, so ``main`` can send it straight to
+    the output file without first building it as one string. JSON goes through
+    ``orjson`` when installed (see ``_json_dump``).
+
+    Args:
+        results (List[Dict]): Verification results
+        out (TextIO): Destination stream
+        output_format (str): Output format ('text', 'json', 'markdown')
+        stats (ReportStats): Optional precomputed ``compute_stats(results)``
+            (unused for JSON)
+        timestamp (str): Optional "Generated" time (unused for JSON)
+    """
     if output_format == 'json':
-        return json.dumps(results, indent=2, ensure_ascii=False)
+        _json_dump(results, out)
     elif output_format == 'markdown':
-        return generate_markdown_report(results)
+        write_markdown_report(results, out, stats, timestamp)
     else:
-        return generate_text_report(results)
+        write_text_report(results, out, stats, timestamp)
+
+
+@contextlib.contextmanager
+def _stdout_report_stream():
+    """Text stream for writing a report to stdout, encoding straight into its byte buffer.
+
+    ``sys.stdout`` is line-buffered on a terminal, so a large report would be
+    flushed line by line; this wrapper collects output in chunks and always
+    writes UTF-8, like reports saved with ``--output``. Falls back to
+    ``sys.stdout`` itself when it has no byte buffer (e.g. replaced by a
+    ``StringIO``).
+    """
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        yield sys.stdout
+        return
+    sys.stdout.flush()
+    out = io.TextIOWrapper(buffer, encoding='utf-8')
+    try:
+        yield out
+    finally:
+        out.flush()
+        out.detach()  # leave sys.stdout's buffer open
 
 
 def main():
@@ -1672,6 +2761,13 @@ Repository: https://github.com/lnm8910/citation-doi-validator
     parser.add_argument('--format', '-f', choices=['text', 'json', 'markdown', 'md'],
                        default='markdown',
                        help='Output format: text, json, markdown/md (default: markdown)')
+    parser.add_argument('--workers', '-w', type=int, default=DEFAULT_WORKERS,
+                       help=f'Citations verified concurrently (default: {DEFAULT_WORKERS}; 1 = serial)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'Do not read or write the lookup cache ({CACHE_PATH})')
+    parser.add_argument('--cache-ttl-days', type=float, default=CACHE_TTL_SECONDS / 86400,
+                       help=f'Days before a cached lookup is re-fetched '
+                            f'(default: {CACHE_TTL_SECONDS // 86400:g})')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     parser.add_argument('--version', action='version',
@@ -1682,9 +2778,19 @@ Repository: https://github.com/lnm8910/citation-doi-validator
     # Validate arguments
     if not args.key and (args.start is None or args.end is None):
         parser.error("Must specify either --key or both --start and --end")
-
-    # Initialize verifier
-    verifier = CitationVerifier(verbose=args.verbose)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.cache_ttl_days < 0:
+        parser.error("--cache-ttl-days must not be negative")
+
+    # Initialize verifier (with the persistent lookup cache unless disabled)
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ResponseCache(ttl=args.cache_ttl_days * 86400)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: lookup cache unavailable ({e}); continuing without it", file=sys.stderr)
+    verifier = CitationVerifier(verbose=args.verbose, cache=cache)
 
     # Parse BibTeX file
     bib_path = Path(args.bib)
@@ -1713,46 +2819,56 @@ Repository: https://github.com/lnm8910/citation-doi-validator
         entries_to_verify = entries[start_idx:end_idx]
 
     print(f"Verifying {len(entries_to_verify)} citations...", file=sys.stderr)
-
-    # Verify each citation
-    results = []
-    for i, entry in enumerate(entries_to_verify, 1):
-        print(f"  [{i}/{len(entries_to_verify)}] Verifying: {entry['key']}", file=sys.stderr)
-        result = verifier.verify_citation(entry)
-        results.append(result)
+    duplicates = len(entries_to_verify) - len({entry_verification_key(e) for e in entries_to_verify})
+    if duplicates:
+        print(f"Skipping {duplicates} duplicate entries (each reuses the result of an identical citation)",
+              file=sys.stderr)
+
+    # Verify citations (concurrently across --workers threads; order is preserved)
+    def show_progress(i, total, entry):
+        print(f"  [{i}/{total}] Verifying: {entry['key']}", file=sys.stderr)
+
+    try:
+        results = verifier.verify_citations(entries_to_verify, workers=args.workers, progress=show_progress)
+    finally:
+        if cache is not None:
+            cache.close()
+    # Grouped once; shared by the report writer and the summary below
+    stats = compute_stats(results)
+    run_ts = report_timestamp()
 
     # Normalize format (handle 'md' alias)
     output_format = 'markdown' if args.format == 'md' else args.format
 
-    # Generate report
-    report = generate_report(results, output_format=output_format)
-
-    # Output report
+    # Write report (streamed, never held in memory as a whole)
     if args.output:
         output_path = Path(args.output)
-        output_path.write_text(report, encoding='utf-8')
+        with output_path.open('w', encoding='utf-8') as f:
+            write_report(results, f, output_format=output_format, stats=stats, timestamp=run_ts)
         print(f"\n✅ Report saved to: {output_path}", file=sys.stderr)
     else:
-        print("\n" + report)
+        with _stdout_report_stream() as out:
+            out.write("\n")
+            write_report(results, out, output_format=output_format, stats=stats, timestamp=run_ts)
+            out.write("\n")
 
     # Print summary to stderr
-    statuses = {}
-    for r in results:
-        status = r['verification']['overall_status']
-        statuses[status] = statuses.get(status, 0) + 1
 
     print("\n" + "=" * 60, file=sys.stderr)
     print("VERIFICATION SUMMARY", file=sys.stderr)
     print("=" * 60, file=sys.stderr)
-    for status, count in sorted(statuses.items()):
-        percentage = (count / len(results)) * 100
+    for status in STATUS_ORDER:
+        count = stats.counts[status]
+        if not count:
+            continue
+        percentage = (count / stats.total) * 100
         print(f"  {status:15s}: {count:3d} ({percentage:5.1f}%)", file=sys.stderr)
     print("=" * 60, file=sys.stderr)
 
     # Exit with error code if fabrications found
-    fabricated = [r for r in results if r['verification']['overall_status'] == 'FABRICATED']
-    if fabricated:
-        print(f"\n⚠️  WARNING: {len(fabricated)} FABRICATED citations detected!", file=sys.stderr)
+    fabricated_count = stats.counts['FABRICATED']
+    if fabricated_count:
+        print(f"\n⚠️  WARNING: {fabricated_count} FABRICATED citations detected!", file=sys.stderr)
         sys.exit(1)
 
     sys.exit(0)
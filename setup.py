@@ -32,6 +32,10 @@ setup(
         'requests>=2.28.0',
     ],
     extras_require={
+        'fast': [
+            'orjson>=3.8',
+            'rapidfuzz>=3.0',
+        ],
         'dev': [
             'pytest>=7.0.0',
             'pytest-cov>=4.0.0',